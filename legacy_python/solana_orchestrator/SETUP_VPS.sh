@@ -24,7 +24,7 @@ sudo apt-get upgrade -y
 echo -e "${GREEN}✅ System updated${NC}"
 echo ""
 
-# Step 2: Install Python 3.10+ if not present
+# Step 2: Install Python 3.11+ if not present
 echo -e "${BLUE}🐍 Step 2: Checking Python installation...${NC}"
 if ! command -v python3 &> /dev/null; then
     echo "Installing Python 3..."
@@ -33,6 +33,12 @@ else
     PYTHON_VERSION=$(python3 --version)
     echo "✅ Python already installed: $PYTHON_VERSION"
 fi
+# The scanner uses asyncio.TaskGroup, which needs Python 3.11 (Ubuntu 22.04's apt ships 3.10)
+if ! python3 -c 'import sys; sys.exit(sys.version_info < (3, 11))'; then
+    echo -e "${RED}❌ Python 3.11+ is required, found $(python3 --version 2>&1)${NC}"
+    echo "   Install Python 3.11 or newer and make it the python3 on PATH, then re-run this script."
+    exit 1
+fi
 echo ""
 
 # Step 3: Install system dependencies for Playwright/Chromium
@@ -67,7 +73,7 @@ echo ""
 # Step 4: Install Python packages
 echo -e "${BLUE}📦 Step 4: Installing Python packages...${NC}"
 pip3 install --upgrade pip
-pip3 install playwright requests asyncio
+pip3 install -r "$(dirname "$0")/requirements.txt"
 echo -e "${GREEN}✅ Python packages installed${NC}"
 echo ""
 
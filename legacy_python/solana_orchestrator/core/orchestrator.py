@@ -24,17 +24,28 @@ Version: 2.1 - Complete Edition
 """
 
 import json
+import io
+import orjson
+import hashlib
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+import ijson
+import msgspec
 import os
 import time
 import random
-from typing import List, Dict, Optional
+from pathlib import Path
+from typing import List, Dict, Iterable, Optional, Union
 import logging
-from datetime import datetime
-import argparse
 import sys
+import signal
+import threading
 import asyncio
-from playwright_multi_page_analyzer import create_playwright_analyzer
+import httpx
+from aiolimiter import AsyncLimiter
+from playwright_multi_page_analyzer import create_playwright_analyzer, run_async
 
 # Colors for beautiful terminal output
 class Colors:
@@ -48,9 +59,24 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Frequently repeated color prefixes and separator lines, built once
+_SEP80 = '=' * 80
+_H_BOLD_CYAN = Colors.BOLD + Colors.CYAN
+_H_BOLD_RED = Colors.BOLD + Colors.RED
+_H_BOLD_GREEN = Colors.BOLD + Colors.GREEN
+_SEP80_CYAN = Colors.CYAN + _SEP80 + Colors.ENDC
+_SEP80_RED = Colors.RED + _SEP80 + Colors.ENDC
+_SEP80_BOLD_CYAN = _H_BOLD_CYAN + _SEP80 + Colors.ENDC
+_SEP80_BOLD_GREEN = _H_BOLD_GREEN + _SEP80 + Colors.ENDC
+
+# Project directories, resolved once at import
+_HERE = Path(__file__).resolve().parent
+_DATA_DIR = (_HERE / '..' / 'data').resolve()
+_LOGS_DIR = (_HERE / '..' / 'logs').resolve()
+
 # Set up logging
-log_file = os.path.join(os.path.dirname(__file__), '..', 'logs', 'orchestrator.log')
-os.makedirs(os.path.dirname(log_file), exist_ok=True)
+log_file = _LOGS_DIR / 'orchestrator.log'
+os.makedirs(_LOGS_DIR, exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -61,12 +87,228 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _first_by_key(records: List, keys: List) -> List:
+    """
+    records deduplicated by the parallel keys list, keeping the first record
+    per key in first-seen order and dropping records with an empty key. Both
+    passes are single dict builds rather than a per-record membership loop.
+    """
+    first = dict(zip(reversed(keys), reversed(records)))
+    return [first[key] for key in dict.fromkeys(keys) if key]
+
+class HolderTable:
+    """
+    Column-oriented holder list for a single token. Holds one list per field
+    instead of one dict per holder. Values are kept exactly as the API sent
+    them (decimal strings, ints or floats) so holders.json is unchanged.
+    to_jsonable() produces the usual list-of-dicts shape used in holders.json.
+    """
+    __slots__ = ('addresses', 'balance', 'balance_formatted', 'usd_value', 'percentage')
+    
+    def __init__(self):
+        self.addresses: List[str] = []
+        self.balance: List[_Amount] = []
+        self.balance_formatted: List[_Amount] = []
+        self.usd_value: List[_Amount] = []
+        self.percentage: List[_Amount] = []
+    
+    def __len__(self) -> int:
+        return len(self.addresses)
+    
+    def append(self, owner_address: str, balance, balance_formatted, usd_value, percentage):
+        self.addresses.append(owner_address)
+        self.balance.append(balance)
+        self.balance_formatted.append(balance_formatted)
+        self.usd_value.append(usd_value)
+        self.percentage.append(percentage)
+    
+    @classmethod
+    def from_records(cls, holders: Iterable[Dict]) -> 'HolderTable':
+        """Build a table from holder dicts, one row per owner in first-seen order"""
+        table = cls()
+        holders = list(holders)
+        
+        for holder in _first_by_key(holders, [holder.get('ownerAddress') for holder in holders]):
+            table.append(
+                holder['ownerAddress'],
+                holder.get('balance'),
+                holder.get('balanceFormatted'),
+                holder.get('usdValue'),
+                holder.get('percentageRelativeToTotalSupply')
+            )
+        
+        return table
+    
+    @classmethod
+    def from_structs(cls, holders: Iterable['MoralisHolder']) -> 'HolderTable':
+        """Build a table from decoded MoralisHolder structs, one row per owner in first-seen order"""
+        table = cls()
+        holders = list(holders)
+        
+        for holder in _first_by_key(holders, [holder.ownerAddress for holder in holders]):
+            table.append(
+                holder.ownerAddress,
+                holder.balance,
+                holder.balanceFormatted,
+                holder.usdValue,
+                holder.percentageRelativeToTotalSupply
+            )
+        
+        return table
+    
+    def to_jsonable(self) -> List[Dict]:
+        return [
+            {
+                "ownerAddress": owner_address,
+                "balance": balance,
+                "balanceFormatted": balance_formatted,
+                "usdValue": usd_value,
+                "percentageRelativeToTotalSupply": percentage
+            }
+            for owner_address, balance, balance_formatted, usd_value, percentage in zip(
+                self.addresses, self.balance, self.balance_formatted, self.usd_value, self.percentage
+            )
+        ]
+
+# Typed views of the Moralis/Birdeye responses, decoded straight from bytes by msgspec.
+# Unknown fields are ignored; amounts accept either the API's strings or plain numbers,
+# and the decoders are non-strict so numeric fields sent as strings ("12.5") are coerced.
+# gc=False: these only hold scalars or lists of each other, so they can never form
+# reference cycles and needn't be tracked by the cyclic GC (≈100 per response).
+# int is listed before float so whole numbers stay ints, as they were in the response.
+_Amount = Union[str, int, float, None]
+_Number = Union[int, float, None]
+
+class MoralisHolder(msgspec.Struct, gc=False):
+    ownerAddress: Optional[str] = None
+    balance: _Amount = None
+    balanceFormatted: _Amount = None
+    usdValue: _Amount = None
+    percentageRelativeToTotalSupply: _Amount = None
+
+class MoralisHoldersResponse(msgspec.Struct, gc=False):
+    result: Optional[List[MoralisHolder]] = None
+
+class BirdeyeTrader(msgspec.Struct, gc=False):
+    owner: Optional[str] = None
+    volume: _Number = None
+    trade: _Number = None
+    tradeBuy: _Number = None
+    tradeSell: _Number = None
+    volumeBuy: _Number = None
+    volumeSell: _Number = None
+
+class BirdeyeTradersData(msgspec.Struct, gc=False):
+    items: Optional[List[BirdeyeTrader]] = None
+
+class BirdeyeTradersResponse(msgspec.Struct, gc=False):
+    success: bool = False
+    data: Optional[BirdeyeTradersData] = None
+
+def _orjson_default(obj):
+    if isinstance(obj, HolderTable):
+        return obj.to_jsonable()
+    raise TypeError
+
+CONFIG_PATH = os.path.join(_HERE, '..', 'config', 'config.json')
+
+@functools.lru_cache(maxsize=1)
+def _load_config(path: str, mtime: float) -> Dict:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def load_config(path: str = CONFIG_PATH) -> Dict:
+    """
+    Parsed config.json, shared across orchestrator instances. The file's mtime
+    is part of the cache key, so edits between auto-loop cycles are picked up.
+    Treat the returned dict as read-only.
+    """
+    return _load_config(path, os.path.getmtime(path))
+
+# On-disk cache for per-token API responses
+API_CACHE_DIR = os.path.join(_DATA_DIR, 'api_cache')
+API_CACHE_TTL = 3600
+
+def _cache_path(key: str) -> str:
+    return os.path.join(API_CACHE_DIR, f"{hashlib.sha1(key.encode()).hexdigest()}.json")
+
+def _cache_get(key: str, ttl: float):
+    """Return the cached payload for key, or None if missing or older than ttl seconds"""
+    try:
+        with open(_cache_path(key), 'rb') as f:
+            entry = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if time.time() - entry.get("t", 0) > ttl:
+        # Expired: drop it so the cache doesn't grow without bound
+        try:
+            os.remove(_cache_path(key))
+        except OSError:
+            pass
+        return None
+    return entry.get("v")
+
+def _prune_api_cache(ttl: float = API_CACHE_TTL) -> int:
+    """Delete cache entries older than ttl, including tokens that are never looked up again"""
+    cutoff = time.time() - ttl
+    removed = 0
+    try:
+        with os.scandir(API_CACHE_DIR) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except OSError:
+                    pass
+    except FileNotFoundError:
+        pass
+    return removed
+
+def _cache_put(key: str, value):
+    """Store a payload in the on-disk cache (best effort)"""
+    try:
+        os.makedirs(API_CACHE_DIR, exist_ok=True)
+        with open(_cache_path(key), 'wb') as f:
+            f.write(orjson.dumps({"t": time.time(), "v": value}, default=_orjson_default))
+    except OSError as e:
+        logger.debug("Could not write API cache entry %s: %s", key, e)
+
+def _cached(endpoint: str, ttl: float = 3600, decode=None):
+    """
+    Memoize a per-token fetch method on disk, keyed by (endpoint, token_address).
+    The token address must be the last positional argument of the (async)
+    method; failed fetches (None) are never cached. decode, if given,
+    rebuilds the method's return type from the cached JSON payload.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args):
+            key = f"{endpoint}:{args[-1]}"
+            cached = _cache_get(key, ttl)
+            if cached is not None:
+                logger.debug("Cache hit for %s", key)
+                return decode(cached) if decode else cached
+            result = await func(self, *args)
+            if result is not None:
+                _cache_put(key, result)
+            return result
+        return wrapper
+    return decorator
+
+def _write_lines(path: str, lines: List[str]):
+    """Write one entry per line with a single write call"""
+    with open(path, 'w') as f:
+        if lines:
+            f.write("\n".join(lines) + "\n")
+
 class SolanaTokenOrchestrator:
+    # Minimum seconds between in-place progress redraws
+    PROGRESS_INTERVAL = 0.1
+    
     def __init__(self, token_limit=None, num_pages=3, min_winrate=None, min_pnl=None):
         # Load configuration from config.json
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.json')
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = load_config()
 
         self.moralis_api_key = config.get("moralis_api_key")
         if not self.moralis_api_key:
@@ -78,11 +320,28 @@ class SolanaTokenOrchestrator:
         self.birdeye_tokenlist_url = "https://public-api.birdeye.so/defi/tokenlist"
         self.birdeye_top_traders_url = "https://public-api.birdeye.so/defi/v2/tokens/top_traders"
         self.token_holders_url_template = "https://solana-gateway.moralis.io/token/mainnet/{token_address}/top-holders"
+        self._token_holders_url_prefix, self._token_holders_url_suffix = self.token_holders_url_template.split("{token_address}")
+        
+        # Per-endpoint headers and constant query params, built once instead of per call
+        self._moralis_headers = {"accept": "application/json", "X-API-Key": self.moralis_api_key}
+        self._birdeye_headers = {"accept": "application/json", "X-API-KEY": self.birdeye_api_key, "x-chain": "solana"}
+        self._token_holders_params = {"limit": 100}
+        self._holders_decoder = msgspec.json.Decoder(MoralisHoldersResponse, strict=False)
+        self._traders_decoder = msgspec.json.Decoder(BirdeyeTradersResponse, strict=False)
+        self._birdeye_top_traders_params_template = {
+            "time_frame": "24h",
+            "sort_by": "volume",
+            "sort_type": "desc",
+            "offset": 0,
+            "limit": 100,
+            "ui_amount_mode": "scaled"
+        }
         
         # Output files - use data directory
-        data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+        data_dir = _DATA_DIR
         self.tokens_file = os.path.join(data_dir, "tokens.json")
         self.holders_file = os.path.join(data_dir, "holders.json")
+        self.holders_jsonl = os.path.join(data_dir, "holders.jsonl")
         self.tokens_txt = os.path.join(data_dir, "tokens.txt")
         self.holders_txt = os.path.join(data_dir, "holders.txt")
         self.good_wallets_file = os.path.join(data_dir, "good_wallets.json")
@@ -103,35 +362,58 @@ class SolanaTokenOrchestrator:
         config_token_limit = config.get("api_settings", {}).get("token_limit", 100)
         self.token_limit = token_limit if token_limit is not None else config_token_limit
         
+        # Maximum number of in-flight holder/trader requests during collection
+        self.max_concurrent_requests = config.get("api_settings", {}).get("max_concurrent_requests", 10)
+        
+        # Per-second caps for each API; the token buckets themselves are created per run,
+        # since an AsyncLimiter is bound to the event loop it is first used on
+        self.moralis_rps = config.get("api_settings", {}).get("moralis_rps", 10)
+        self.birdeye_rps = config.get("api_settings", {}).get("birdeye_rps", 10)
+        
+        # Shared HTTP session so repeated calls to Birdeye/Moralis reuse keep-alive connections
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=50))
+        self.session.headers.update({"accept": "application/json"})
+        
+        self._last_tick = 0.0
+    
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        
     def fetch_graduated_tokens(self) -> List[Dict]:
         """Fetch graduated PumpFun tokens from Moralis API"""
         logger.info("Fetching graduated PumpFun tokens...")
         
-        headers = {"accept": "application/json", "X-API-Key": self.moralis_api_key}
         params = {"limit": self.token_limit}
         
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(self.pumpfun_graduated_tokens_url, headers=headers, params=params)
-                response.raise_for_status()
+                with self.session.get(self.pumpfun_graduated_tokens_url, headers=self._moralis_headers, params=params, stream=True) as response:
+                    response.raise_for_status()
+                    tokens = list(self._stream_items(response, 'result.item'))
                 
-                data = response.json()
-                if 'result' not in data:
-                    logger.error("No 'result' field in response")
+                if not tokens:
+                    logger.error("No 'result' items in response")
                     return []
                 
-                tokens = data['result']
-                logger.info(f"Fetched {len(tokens)} graduated tokens")
+                logger.info("Fetched %s graduated tokens", len(tokens))
                 return tokens
                 
             except requests.exceptions.RequestException as e:
-                logger.error(f"Attempt {attempt+1} failed: {e}")
+                logger.error("Attempt %s failed: %s", attempt+1, e)
                 if attempt < self.max_retries - 1:
                     time.sleep(2 ** attempt)  # Exponential backoff
                 else:
                     logger.error("All attempts failed")
                     return []
-            except json.JSONDecodeError:
+            except ijson.JSONError:
                 logger.error("Failed to decode JSON response")
                 return []
                 
@@ -142,11 +424,6 @@ class SolanaTokenOrchestrator:
             logger.error("Birdeye API key not found in config.json")
             return []
 
-        headers = {
-            "X-API-KEY": self.birdeye_api_key,
-            "accept": "application/json",
-            "x-chain": "solana"
-        }
         params = {
             "sort_by": "liquidity",
             "sort_type": "desc",
@@ -158,244 +435,315 @@ class SolanaTokenOrchestrator:
         }
 
         try:
-            response = requests.get(self.birdeye_tokenlist_url, headers=headers, params=params)
-            response.raise_for_status()
-            result = response.json()
-            
-            # Birdeye API returns data in format: {"success": true, "data": {"tokens": [...]}}
-            if result.get("success") and "data" in result and "tokens" in result["data"]:
-                tokens = result["data"]["tokens"]
+            with self.session.get(self.birdeye_tokenlist_url, headers=self._birdeye_headers, params=params, stream=True) as response:
+                response.raise_for_status()
+                
+                # Birdeye API returns data in format: {"success": true, "data": {"tokens": [...]}}
                 # Adapt Birdeye response to match Moralis format
-                adapted_tokens = []
-                for token in tokens:
-                    if "address" in token:
-                        adapted_tokens.append({"tokenAddress": token["address"]})
-                logger.info(f"Fetched {len(adapted_tokens)} tokens from Birdeye.")
+                adapted_tokens = [
+                    {"tokenAddress": token["address"]}
+                    for token in self._stream_items(response, 'data.tokens.item')
+                    if "address" in token
+                ]
+            
+            if adapted_tokens:
+                logger.info("Fetched %s tokens from Birdeye.", len(adapted_tokens))
                 return adapted_tokens
             else:
                 logger.warning("No tokens found in Birdeye response.")
                 return []
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to fetch tokens from Birdeye: {e}")
+            logger.error("Failed to fetch tokens from Birdeye: %s", e)
             return []
-        except Exception as e:
-            logger.error(f"An unexpected error occurred while fetching from Birdeye: {e}")
+        except (ijson.JSONError, TypeError) as e:
+            logger.error("Failed to parse Birdeye token list: %r", e)
             return []
     
-    def fetch_top_traders(self, token_address: str) -> Optional[List[Dict]]:
+    @staticmethod
+    def _stream_items(response: requests.Response, prefix: str):
         """
-        Fetch top traders for a token from Birdeye API.
-        Returns list of top traders with their wallet addresses and trade info.
+        Stream-parse the JSON array at `prefix` (e.g. 'result.item') straight
+        from a stream=True response body, yielding one item at a time instead
+        of building the whole document first.
         """
-        logger.debug(f"Fetching top traders for {token_address} from Birdeye...")
-        
-        if not self.birdeye_api_key:
-            logger.error("Birdeye API key not found - cannot fetch top traders")
-            return None
-        
-        headers = {
-            "X-API-KEY": self.birdeye_api_key,
-            "accept": "application/json",
-            "x-chain": "solana"
-        }
-        params = {
-            "address": token_address,
-            "time_frame": "24h",
-            "sort_by": "volume",
-            "sort_type": "desc",
-            "offset": 0,
-            "limit": 100,
-            "ui_amount_mode": "scaled"
-        }
+        response.raw.decode_content = True
+        try:
+            yield from ijson.items(response.raw, prefix, use_float=True)
+        except urllib3.exceptions.HTTPError as e:
+            # Reading response.raw bypasses requests' own exception wrapping
+            raise requests.exceptions.ConnectionError(e) from e
+    
+    @staticmethod
+    def _process_trader_structs(traders: Iterable[BirdeyeTrader]) -> List[Dict]:
+        """Project decoded BirdeyeTrader structs to plain dicts, deduplicated by owner"""
+        traders = list(traders)
+        return [msgspec.structs.asdict(trader) for trader in _first_by_key(traders, [trader.owner for trader in traders])]
+    
+    def _progress_due(self, final: bool = False) -> bool:
+        """True if a progress redraw is due (always for the final update)"""
+        now = time.monotonic()
+        if not final and now - self._last_tick < self.PROGRESS_INTERVAL:
+            return False
+        self._last_tick = now
+        return True
+    
+    @staticmethod
+    def _retry_after(response: httpx.Response, wait_time: float) -> float:
+        """Honor a numeric Retry-After header on 429s, never waiting less than our own backoff"""
+        try:
+            return max(float(response.headers.get("Retry-After", wait_time)), wait_time)
+        except ValueError:
+            return wait_time
+    
+    def _new_http_client(self) -> httpx.AsyncClient:
+        """Create an HTTP/2 client for one collection phase; concurrent requests share multiplexed connections"""
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=30.0
+        )
+    
+    @_cached(endpoint="holders", ttl=API_CACHE_TTL, decode=HolderTable.from_records)
+    async def _fetch_holders_async(self, client: httpx.AsyncClient, sem: asyncio.Semaphore,
+                                   limiter: AsyncLimiter, token_address: str) -> Optional[HolderTable]:
+        """
+        Fetch the top 100 holders for one token, with retries and exponential
+        backoff. At most `sem` requests are in
+        flight at once and `limiter` paces them under Moralis' rate cap; backoff
+        sleeps happen outside both so a rate-limited token doesn't hold a slot while waiting.
+        """
+        url = self._token_holders_url_prefix + token_address + self._token_holders_url_suffix
         
-        for attempt in range(self.max_retries):
+        for attempt in range(self.max_retries + 1):
             wait_time = (2 ** attempt) + random.uniform(0, 1)
             try:
-                start_time = time.time()
-                response = requests.get(self.birdeye_top_traders_url, headers=headers, params=params, timeout=30)
-                end_time = time.time()
+                async with sem, limiter:
+                    start_time = time.time()
+                    response = await client.get(url, headers=self._moralis_headers, params=self._token_holders_params)
+                    end_time = time.time()
                 
-                logger.debug(f"Top traders API call for {token_address} took {end_time - start_time:.2f} seconds.")
+                logger.debug("API call for %s took %.2f seconds.", token_address, end_time - start_time)
                 
                 if response.status_code == 429:
-                    logger.warning(f"Rate limit hit for top traders {token_address}. Waiting {wait_time:.2f}s...")
-                    time.sleep(wait_time)
+                    wait_time = self._retry_after(response, wait_time)
+                    logger.warning("Rate limit hit for %s. Waiting %.2fs before retrying...", token_address, wait_time)
+                    await asyncio.sleep(wait_time)
                     continue
                 
                 response.raise_for_status()
-                data = response.json()
+                data = self._holders_decoder.decode(response.content)
+                if data.result is None:
+                    logger.error("No 'result' field in response for %s", token_address)
+                    return None
                 
-                # Birdeye format: {"success": true, "data": {"items": [...]}}
-                if data.get("success") and "data" in data and "items" in data["data"]:
-                    traders = data["data"]["items"]
-                    processed_traders = []
-                    seen_traders = set()
-                    
-                    for trader in traders:
-                        # Extract owner (wallet address) from the trader data
-                        owner = trader.get('owner')
-                        if owner and owner not in seen_traders:
-                            processed_traders.append({
-                                "owner": owner,
-                                "volume": trader.get('volume'),
-                                "trade": trader.get('trade'),
-                                "tradeBuy": trader.get('tradeBuy'),
-                                "tradeSell": trader.get('tradeSell'),
-                                "volumeBuy": trader.get('volumeBuy'),
-                                "volumeSell": trader.get('volumeSell')
-                            })
-                            seen_traders.add(owner)
-                    
-                    logger.debug(f"Retrieved {len(processed_traders)} top traders for {token_address}")
-                    return processed_traders
-                else:
-                    logger.warning(f"No traders data in Birdeye response for {token_address}")
-                    return []
-                    
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout fetching top traders for {token_address} (attempt {attempt+1}/{self.max_retries})")
-                if attempt < self.max_retries - 1:
-                    time.sleep(wait_time)
+                processed_holders = HolderTable.from_structs(data.result)
+                logger.debug("Retrieved %s unique holders for %s", len(processed_holders), token_address)
+                return processed_holders
+            
+            except httpx.TimeoutException:
+                logger.warning("Timeout fetching holders for %s on attempt %s/%s.", token_address, attempt+1, self.max_retries)
+                if attempt < self.max_retries:
+                    await asyncio.sleep(wait_time)
                 else:
-                    logger.error(f"All timeout attempts failed for top traders {token_address}")
+                    logger.error("All retry attempts timed out for %s. Skipping.", token_address)
                     return None
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Failed to fetch top traders for {token_address} (attempt {attempt+1}): {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(wait_time)
+            except httpx.HTTPError as e:
+                logger.error("Failed to get holders for %s (attempt %s): %s", token_address, attempt+1, e)
+                if attempt < self.max_retries:
+                    await asyncio.sleep(wait_time)
                 else:
+                    logger.error("All attempts failed for %s. Skipping.", token_address)
                     return None
-            except json.JSONDecodeError:
-                logger.error(f"Failed to decode JSON for top traders {token_address}")
+            except msgspec.DecodeError:
+                logger.error("Failed to decode JSON for %s. Skipping.", token_address)
                 return None
         
         return None
     
-    def get_token_holders(self, token_address: str) -> Optional[List[Dict]]:
-        """
-        Fetch top 100 holders for a single token with timeouts, retries, and
-        exponential backoff.
-        """
-        logger.debug(f"Fetching holders for {token_address}...")
+    @_cached(endpoint="traders", ttl=API_CACHE_TTL)
+    async def _fetch_traders_async(self, client: httpx.AsyncClient, sem: asyncio.Semaphore,
+                                   limiter: AsyncLimiter, token_address: str) -> Optional[List[Dict]]:
+        """Fetch top traders for one token from Birdeye, bounded by `sem` like _fetch_holders_async"""
+        if not self.birdeye_api_key:
+            logger.error("Birdeye API key not found - cannot fetch top traders")
+            return None
         
-        headers = {
-            "accept": "application/json", 
-            "X-API-Key": self.moralis_api_key
-        }
-        params = {"limit": 100}
-        url = self.token_holders_url_template.format(token_address=token_address)
+        params = {**self._birdeye_top_traders_params_template, "address": token_address}
         
-        for attempt in range(self.max_retries + 1):
+        for attempt in range(self.max_retries):
             wait_time = (2 ** attempt) + random.uniform(0, 1)
             try:
-                start_time = time.time()
-                response = requests.get(url, headers=headers, params=params, timeout=30)
-                end_time = time.time()
+                async with sem, limiter:
+                    start_time = time.time()
+                    response = await client.get(self.birdeye_top_traders_url, headers=self._birdeye_headers, params=params)
+                    end_time = time.time()
+                
+                logger.debug("Top traders API call for %s took %.2f seconds.", token_address, end_time - start_time)
                 
-                logger.debug(f"API call for {token_address} took {end_time - start_time:.2f} seconds.")
-
                 if response.status_code == 429:
-                    logger.warning(f"Rate limit hit for {token_address}. Waiting {wait_time:.2f}s before retrying...")
-                    time.sleep(wait_time)
+                    wait_time = self._retry_after(response, wait_time)
+                    logger.warning("Rate limit hit for top traders %s. Waiting %.2fs...", token_address, wait_time)
+                    await asyncio.sleep(wait_time)
                     continue
-
-                response.raise_for_status()
                 
-                data = response.json()
-                if 'result' not in data:
-                    logger.error(f"No 'result' field in response for {token_address}")
+                response.raise_for_status()
+                data = self._traders_decoder.decode(response.content)
+                if data.success and data.data is not None and data.data.items is not None:
+                    processed_traders = self._process_trader_structs(data.data.items)
+                    logger.debug("Retrieved %s top traders for %s", len(processed_traders), token_address)
+                    return processed_traders
+                else:
+                    # success: false is a Birdeye error body; None keeps it out of the cache
+                    logger.warning("No traders data in Birdeye response for %s", token_address)
                     return None
-                
-                holders_data = data['result']
-                processed_holders = []
-                seen_holders = set()
-
-                for holder in holders_data:
-                    owner_address = holder.get('ownerAddress')
-                    if owner_address and owner_address not in seen_holders:
-                        processed_holders.append({
-                            "ownerAddress": owner_address,
-                            "balance": holder.get('balance'),
-                            "balanceFormatted": holder.get('balanceFormatted'),
-                            "usdValue": holder.get('usdValue'),
-                            "percentageRelativeToTotalSupply": holder.get('percentageRelativeToTotalSupply')
-                        })
-                        seen_holders.add(owner_address)
-                
-                logger.debug(f"Retrieved {len(processed_holders)} unique holders for {token_address}")
-                return processed_holders
             
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout fetching holders for {token_address} on attempt {attempt+1}/{self.max_retries}.")
-                if attempt < self.max_retries:
-                    logger.info(f"Waiting {wait_time:.2f}s before retrying...")
-                    time.sleep(wait_time)
+            except httpx.TimeoutException:
+                logger.warning("Timeout fetching top traders for %s (attempt %s/%s)", token_address, attempt+1, self.max_retries)
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(wait_time)
                 else:
-                    logger.error(f"All retry attempts timed out for {token_address}. Skipping.")
+                    logger.error("All timeout attempts failed for top traders %s", token_address)
                     return None
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Failed to get holders for {token_address} (attempt {attempt+1}): {e}")
-                if attempt < self.max_retries:
-                    time.sleep(wait_time)
+            except httpx.HTTPError as e:
+                logger.error("Failed to fetch top traders for %s (attempt %s): %s", token_address, attempt+1, e)
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(wait_time)
                 else:
-                    logger.error(f"All attempts failed for {token_address}. Skipping.")
                     return None
-            except json.JSONDecodeError:
-                logger.error(f"Failed to decode JSON for {token_address}. Skipping.")
+            except msgspec.DecodeError:
+                logger.error("Failed to decode JSON for top traders %s", token_address)
                 return None
         
         return None
     
+    async def _collect_holders_async(self, client: httpx.AsyncClient, limiter: AsyncLimiter, pending: List[tuple],
+                                     holders_data: Dict[str, HolderTable], unique_wallets: set, on_wallets=None,
+                                     on_progress=None):
+        """
+        Fetch holders for all (index, token_address) pairs concurrently into
+        holders_data. Each token's result is appended to holders.jsonl as it
+        arrives so an interrupted run can resume without rewriting holders.json.
+        unique_wallets is kept up to date for the running wallet count, and
+        on_wallets (if given) is called with each token's holder addresses.
+        """
+        sem = asyncio.Semaphore(self.max_concurrent_requests)
+        done = 0
+        
+        with open(self.holders_jsonl, 'ab') as checkpoint:
+            async def fetch_one(token_address):
+                nonlocal done
+                holders = await self._fetch_holders_async(client, sem, limiter, token_address)
+                done += 1
+                if holders is not None:
+                    holders_data[token_address] = holders
+                    unique_wallets.update(holders.addresses)
+                    if on_wallets:
+                        on_wallets(holders.addresses)
+                    checkpoint.write(orjson.dumps({"token": token_address, "holders": holders}, default=_orjson_default) + b"\n")
+                    checkpoint.flush()
+                else:
+                    logger.error("Failed to get holders for %s after all retries.", token_address)
+                
+                if on_progress:
+                    on_progress(done, len(pending))
+            
+            await asyncio.gather(*[fetch_one(token_address) for _, token_address in pending])
+    
+    async def _collect_traders_async(self, client: httpx.AsyncClient, limiter: AsyncLimiter, pending: List[tuple],
+                                     trader_wallets: set, on_wallets=None, on_progress=None) -> Dict[str, List[Dict]]:
+        """
+        Fetch top traders for all (index, token_address) pairs concurrently,
+        adding every trader wallet to trader_wallets as results arrive and
+        passing them to on_wallets if given.
+        """
+        sem = asyncio.Semaphore(self.max_concurrent_requests)
+        collected = {}
+        done = 0
+        
+        async def fetch_one(token_address):
+            nonlocal done
+            traders = await self._fetch_traders_async(client, sem, limiter, token_address)
+            done += 1
+            if traders:
+                collected[token_address] = traders
+                trader_wallets.update(t['owner'] for t in traders)
+                if on_wallets:
+                    on_wallets(t['owner'] for t in traders)
+            
+            if on_progress:
+                on_progress(done, len(pending))
+        
+        await asyncio.gather(*[fetch_one(token_address) for _, token_address in pending])
+        
+        return collected
+    
     def save_tokens(self, tokens: List[Dict]):
         """Save tokens to JSON and TXT files"""
-        logger.info(f"Saving {len(tokens)} tokens to files...")
+        logger.info("Saving %s tokens to files...", len(tokens))
         
         # Save to JSON
-        with open(self.tokens_file, 'w') as f:
-            json.dump(tokens, f, indent=2)
+        with open(self.tokens_file, 'wb') as f:
+            f.write(orjson.dumps(tokens, option=orjson.OPT_INDENT_2))
         
         # Extract just token addresses and save to TXT
         token_addresses = [token.get('tokenAddress', '') for token in tokens if token.get('tokenAddress')]
-        with open(self.tokens_txt, 'w') as f:
-            for address in token_addresses:
-                f.write(f"{address}\n")
+        _write_lines(self.tokens_txt, token_addresses)
         
-        logger.info(f"Saved {len(token_addresses)} token addresses to {self.tokens_txt}")
+        logger.info("Saved %s token addresses to %s", len(token_addresses), self.tokens_txt)
     
-    def save_holders(self, holders_data: Dict[str, List[Dict]]):
+    def save_holders(self, holders_data: Dict[str, HolderTable]):
         """Save holders to JSON and TXT files"""
-        logger.debug(f"Saving holders data for {len(holders_data)} tokens...")
+        logger.debug("Saving holders data for %s tokens...", len(holders_data))
         
         # Save full holders data to JSON
-        with open(self.holders_file, 'w') as f:
-            json.dump(holders_data, f, indent=2)
+        with open(self.holders_file, 'wb') as f:
+            f.write(orjson.dumps(holders_data, default=_orjson_default, option=orjson.OPT_INDENT_2))
+        
+        # holders.json now contains everything the append-only checkpoint had
+        if os.path.exists(self.holders_jsonl):
+            os.remove(self.holders_jsonl)
         
         # Extract all unique holder addresses and save to TXT
         all_holder_addresses = set()
         for token_holders in holders_data.values():
-            for holder in token_holders:
-                if 'ownerAddress' in holder and holder['ownerAddress']:
-                    all_holder_addresses.add(holder['ownerAddress'])
+            all_holder_addresses.update(token_holders.addresses)
         
-        with open(self.holders_txt, 'w') as f:
-            for address in sorted(all_holder_addresses):
-                f.write(f"{address}\n")
+        # Sort and join once; owner_addresses.txt gets the same content for compatibility
+        addresses_sorted = sorted(all_holder_addresses)
+        blob = "\n".join(addresses_sorted) + "\n" if addresses_sorted else ""
+        for path in (self.holders_txt, self.owner_addresses_file):
+            with open(path, 'w') as f:
+                f.write(blob)
         
-        # Also save to owner_addresses.txt for compatibility
-        with open(self.owner_addresses_file, 'w') as f:
-            for address in sorted(all_holder_addresses):
-                f.write(f"{address}\n")
+        logger.debug("Saved %s unique holder addresses to %s and %s", len(all_holder_addresses), self.holders_txt, self.owner_addresses_file)
+    
+    def load_holders(self) -> Dict[str, HolderTable]:
+        """Load holders.json plus any per-token records appended to holders.jsonl by an interrupted run"""
+        holders_data = {
+            token_address: HolderTable.from_records(holders)
+            for token_address, holders in self.load_json_file(self.holders_file, is_dict=True).items()
+        }
+        
+        if os.path.exists(self.holders_jsonl):
+            with open(self.holders_jsonl, 'rb') as f:
+                for line in f:
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # Partial line from a write that was cut off
+                        continue
+                    holders_data[record["token"]] = HolderTable.from_records(record["holders"])
         
-        logger.debug(f"Saved {len(all_holder_addresses)} unique holder addresses to {self.holders_txt} and {self.owner_addresses_file}")
+        return holders_data
     
     def load_json_file(self, file_path: str, is_dict: bool = False) -> List or Dict:
         """Load JSON file with error handling"""
         if os.path.exists(file_path):
             try:
-                with open(file_path, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                logger.warning(f"Could not decode JSON from {file_path}. Starting fresh.")
+                with open(file_path, 'rb') as f:
+                    return orjson.loads(f.read())
+            except orjson.JSONDecodeError:
+                logger.warning("Could not decode JSON from %s. Starting fresh.", file_path)
                 return {} if is_dict else []
         return {} if is_dict else []
     
@@ -406,7 +754,7 @@ class SolanaTokenOrchestrator:
                 with open(file_path, 'r') as f:
                     return [line.strip() for line in f if line.strip()]
             except Exception as e:
-                logger.warning(f"Could not read {file_path}: {e}")
+                logger.warning("Could not read %s: %s", file_path, e)
                 return []
         return []
     
@@ -425,42 +773,50 @@ class SolanaTokenOrchestrator:
             if os.path.exists(src_file):
                 try:
                     shutil.copy2(src_file, dest_file)
-                    logger.info(f"Copied {src_file} -> {dest_file}")
+                    logger.info("Copied %s -> %s", src_file, dest_file)
                     copied_count += 1
                 except Exception as e:
-                    logger.warning(f"Failed to copy {src_file}: {e}")
+                    logger.warning("Failed to copy %s: %s", src_file, e)
         
         if copied_count > 0:
-            logger.info(f"✅ Copied {copied_count} result files to data directory")
+            logger.info("✅ Copied %s result files to data directory", copied_count)
         
         # Also create TXT version from JSON if needed
         if os.path.exists(self.good_wallets_file):
             try:
-                with open(self.good_wallets_file, 'r') as f:
-                    good_wallets = json.load(f)
+                with open(self.good_wallets_file, 'rb') as f:
+                    good_wallets = orjson.loads(f.read())
                 
                 if good_wallets:
-                    with open(self.good_wallets_txt, 'w') as f:
-                        for wallet in good_wallets:
-                            f.write(f"{wallet.get('wallet', 'unknown')}\n")
-                    logger.info(f"Created {self.good_wallets_txt} with {len(good_wallets)} wallet addresses")
+                    _write_lines(self.good_wallets_txt, [wallet.get('wallet', 'unknown') for wallet in good_wallets])
+                    logger.info("Created %s with %s wallet addresses", self.good_wallets_txt, len(good_wallets))
             except Exception as e:
-                logger.warning(f"Failed to create TXT version: {e}")
+                logger.warning("Failed to create TXT version: %s", e)
+    
+    def _new_analyzer(self, wallets: List[str]):
+        """Create a Playwright analyzer configured with this run's filters"""
+        # Set environment variables for the analyzer
+        os.environ["MIN_WINRATE"] = str(self.min_winrate)
+        os.environ["MIN_REALIZED_PNL_USD"] = str(self.min_realized_pnl)
+        
+        # Ensure results directory exists
+        os.makedirs("results", exist_ok=True)
+        
+        return create_playwright_analyzer(
+            num_pages=self.num_pages, 
+            wallets=wallets, 
+            preset=None  # Using manual env vars instead
+        )
     
-    def run_dexcheck_analysis(self):
+    def _make_progress_callback(self, get_total, get_prefix=None):
         """
-        Runs the wallet analysis using the Playwright multi-page analyzer.
+        Build the analyzer's live progress display. get_total returns the
+        current number of wallets to scan; it can grow while streaming.
+        get_prefix, if given, returns text drawn in front of the bar so
+        other phases can share the one in-place line.
+        Returns (progress_callback, draw); draw(final=True) forces a last,
+        unthrottled redraw once the analyzer has returned.
         """
-        logger.info("🔍 Starting DexCheck analysis with Playwright...")
-
-        wallets = self.load_text_file(self.owner_addresses_file)
-        if not wallets:
-            logger.warning("No wallets to analyze (owner_addresses.txt is empty).")
-            return
-
-        logger.info(f"Starting Playwright analysis with {self.num_pages} pages on {len(wallets)} wallets...")
-
-        # Progress tracking
         progress_stats = {'scanned': 0, 'passed': 0, 'failed': 0}
         
         def progress_callback(update):
@@ -473,66 +829,74 @@ class SolanaTokenOrchestrator:
             elif status == 'failed':
                 progress_stats['scanned'] += 1
                 progress_stats['failed'] += 1
+            elif status == 'skipped':
+                # Already scanned in an earlier run: counts toward the total, not passed/failed
+                progress_stats['scanned'] += 1
             
-            # Update in place with \r (carriage return)
+            draw()
+        
+        def draw(final: bool = False):
+            # Update in place with \r (carriage return), at most every PROGRESS_INTERVAL
             scanned = progress_stats['scanned']
+            total = get_total()
+            if not self._progress_due(final=final or scanned >= total):
+                return
+            
             passed = progress_stats['passed']
             failed = progress_stats['failed']
-            percent = (scanned / len(wallets)) * 100 if len(wallets) > 0 else 0
+            percent = (scanned / total) * 100 if total > 0 else 0
             
             # Create progress bar
             bar_width = 30
-            filled = int(bar_width * scanned / len(wallets)) if len(wallets) > 0 else 0
+            filled = int(bar_width * scanned / total) if total > 0 else 0
             bar = '█' * filled + '░' * (bar_width - filled)
             
-            print(f"\r{Colors.CYAN}Progress: [{bar}] {percent:.1f}% | Scanned: {scanned}/{len(wallets)} | {Colors.GREEN}✅ Passed: {passed}{Colors.ENDC} | {Colors.RED}❌ Failed: {failed}{Colors.ENDC}", end='', flush=True)
-
-        try:
-            # Set environment variables for the analyzer
-            os.environ["MIN_WINRATE"] = str(self.min_winrate)
-            os.environ["MIN_REALIZED_PNL_USD"] = str(self.min_realized_pnl)
-            
-            # Ensure results directory exists
-            os.makedirs("results", exist_ok=True)
-
-            analyzer = create_playwright_analyzer(
-                num_pages=self.num_pages, 
-                wallets=wallets, 
-                preset=None  # Using manual env vars instead
-            )
-
-            # Run the asynchronous analyzer
-            results = asyncio.run(analyzer.run(progress_callback=progress_callback))
-
-            # Print newline after progress bar
-            print()
+            prefix = get_prefix() if get_prefix else ""
+            sys.stdout.write(f"\r{Colors.CYAN}{prefix}Progress: [{bar}] {percent:.1f}% | Scanned: {scanned}/{total} | {Colors.GREEN}✅ Passed: {passed}{Colors.ENDC} | {Colors.RED}❌ Failed: {failed}{Colors.ENDC}")
+            sys.stdout.flush()
+        
+        return progress_callback, draw
+    
+    def _report_analysis_results(self, results: Dict):
+        """Log the analyzer summary and copy its output into data/"""
+        # Print newline after progress bar
+        print()
+        
+        if results.get('success'):
+            total_scanned = results.get('total_scanned', 0)
+            total_passed = results.get('total_passed', 0)
+            logger.info("✅ Playwright analysis complete.")
+            logger.info("📊 Summary: Scanned=%s, Passed=%s", total_scanned, total_passed)
             
-            if results.get('success'):
-                total_scanned = results.get('total_scanned', 0)
-                total_passed = results.get('total_passed', 0)
-                logger.info("✅ Playwright analysis complete.")
-                logger.info(f"📊 Summary: Scanned={total_scanned}, Passed={total_passed}")
-                
-                # Copy results from results/ to data/ directory
-                self._copy_analysis_results()
-                
-            else:
-                error_msg = results.get('error', 'Unknown error')
-                logger.error(f"❌ Playwright analysis failed: {error_msg}")
-
-        except Exception as e:
-            logger.error(f"An unexpected error occurred during Playwright analysis: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            # Copy results from results/ to data/ directory
+            self._copy_analysis_results()
             
+        else:
+            error_msg = results.get('error', 'Unknown error')
+            logger.error("❌ Playwright analysis failed: %s", error_msg)
+    
     def run_complete_workflow(self, resume_from: int = 0, token_source: str = 'birdeye', fetch_traders: bool = False):
         """Run the complete workflow: tokens → holders → (optionally traders) → analysis, with resume capability."""
+        run_async(self.run_complete_workflow_async(resume_from, token_source, fetch_traders))
+    
+    async def run_complete_workflow_async(self, resume_from: int = 0, token_source: str = 'birdeye', fetch_traders: bool = False):
+        """
+        Async body of run_complete_workflow. Once tokens are known the phases
+        run as a pipeline: holder and trader wallets are pushed onto a queue as
+        each token's results arrive, and the Playwright pages start analyzing
+        them right away instead of waiting for collection to finish. The
+        holders and traders phases share one HTTP/2 client.
+        """
         logger.info("Starting complete Solana token and wallet analysis workflow...")
         
+        pruned = _prune_api_cache()
+        if pruned:
+            logger.debug("Pruned %s expired API cache entries", pruned)
+        
         # Step 1: Fetch or load tokens
         print("PROGRESS: Starting token collection", flush=True)
         if os.path.exists(self.tokens_file) and resume_from > 0:
-            logger.info(f"Loading existing tokens from {self.tokens_file}")
+            logger.info("Loading existing tokens from %s", self.tokens_file)
             tokens = self.load_json_file(self.tokens_file)
             print(f"PROGRESS: Loaded {len(tokens)} existing tokens", flush=True)
         elif token_source == 'birdeye':
@@ -548,88 +912,106 @@ class SolanaTokenOrchestrator:
         print(f"PROGRESS: Fetched and saved {len(tokens)} tokens", flush=True)
 
         # Step 2: Get holders for each token
-        holders_data = self.load_json_file(self.holders_file, is_dict=True)
+        holders_data = self.load_holders()
         
         start_index = 0
         if resume_from > 0:
             start_index = resume_from - 1
-            logger.info(f"Resuming from token {resume_from}/{len(tokens)}...")
+            logger.info("Resuming from token %s/%s...", resume_from, len(tokens))
             print(f"{Colors.YELLOW}📍 Resuming from token #{resume_from}...{Colors.ENDC}\n")
 
-        print(f"\n{Colors.BOLD}{Colors.CYAN}Collecting token holders...{Colors.ENDC}\n")
+        print(f"\n{_H_BOLD_CYAN}Collecting token holders...{Colors.ENDC}\n")
+        
+        # Running set of unique holder wallets, seeded from any resumed data
+        unique_wallets = {address for table in holders_data.values() for address in table.addresses}
         
+        pending = []
         for i in range(start_index, len(tokens)):
-            token = tokens[i]
-            token_address = token.get('tokenAddress')
+            token_address = tokens[i].get('tokenAddress')
             
             if not token_address:
-                logger.warning(f"Skipping token {i+1} due to missing address.")
+                logger.warning("Skipping token %s due to missing address.", i+1)
                 continue
 
             # Skip if already processed
             if token_address in holders_data:
-                # Show compact skip message
-                print(f"\r{Colors.CYAN}Token {i+1}/{len(tokens)}: {token_address[:8]}...{token_address[-8:]} {Colors.YELLOW}(skipped - already processed){Colors.ENDC}", end='', flush=True)
+                # Show compact skip message (throttled; these arrive in a tight loop)
+                if self._progress_due(final=i == len(tokens) - 1):
+                    sys.stdout.write(f"\r{Colors.CYAN}Token {i+1}/{len(tokens)}: {token_address[:8]}...{token_address[-8:]} {Colors.YELLOW}(skipped - already processed){Colors.ENDC}")
+                    sys.stdout.flush()
                 continue
-
-            # Show current token being processed
-            print(f"\r{Colors.CYAN}Token {i+1}/{len(tokens)}: {token_address[:8]}...{token_address[-8:]} {Colors.YELLOW}Fetching holders...{Colors.ENDC}", end='', flush=True)
             
-            logger.debug(f"Processing token {i+1}/{len(tokens)}: {token_address}")
-            holders = self.get_token_holders(token_address)
+            pending.append((i, token_address))
+        
+        # Wallets flow to the analyzer through this queue as soon as they are known
+        wallet_queue = asyncio.Queue()
+        queued_wallets = set()
+        
+        def enqueue_wallets(addresses: Iterable[str]):
+            for address in addresses:
+                if address not in queued_wallets:
+                    queued_wallets.add(address)
+                    wallet_queue.put_nowait(address)
+        
+        enqueue_wallets(unique_wallets)
+        
+        # Step 4 (pipelined): Playwright analysis consumes the queue while collection runs
+        logger.info("Starting Playwright analysis with %s pages, streaming wallets as they are collected...", self.num_pages)
+        analyzer = self._new_analyzer([])
+        # Holder/trader collection runs alongside the analysis, so its counts go into
+        # the analysis progress line instead of redrawing a line of their own
+        collect_progress = {}
+        
+        def collector_progress(name: str):
+            def report(done: int, count: int):
+                collect_progress[name] = f"{name} {done}/{count} | "
+                draw_progress()
+            return report
+        
+        progress_callback, draw_progress = self._make_progress_callback(
+            lambda: len(queued_wallets), lambda: "".join(collect_progress.values()))
+        analysis_task = asyncio.create_task(analyzer.run_stream(wallet_queue, progress_callback=progress_callback))
+        
+        all_trader_wallets = set()
+        traders_by_token = {}
+        
+        async def collect_holders():
+            if pending:
+                print(f"\r{Colors.CYAN}Fetching holders for {len(pending)} tokens ({self.max_concurrent_requests} concurrent)...{Colors.ENDC}\n")
+                await self._collect_holders_async(client, moralis_limiter, pending, holders_data, unique_wallets,
+                                                  on_wallets=enqueue_wallets, on_progress=collector_progress("Holders"))
             
-            if holders is not None:
-                holders_data[token_address] = holders
-                # Save progress incrementally
-                self.save_holders(holders_data)
-                # Show success
-                print(f"\r{Colors.CYAN}Token {i+1}/{len(tokens)}: {token_address[:8]}...{token_address[-8:]} {Colors.GREEN}✅ {len(holders)} holders | Total wallets: {len(set(h['ownerAddress'] for t in holders_data.values() for h in t))}{Colors.ENDC}")
-            else:
-                print(f"\r{Colors.CYAN}Token {i+1}/{len(tokens)}: {token_address[:8]}...{token_address[-8:]} {Colors.RED}❌ Failed{Colors.ENDC}")
-                logger.error(f"Failed to get holders for {token_address} after all retries.")
-
-            # Add delay between token holder requests
-            if i < len(tokens) - 1:
-                time.sleep(random.uniform(1.5, 3.0))
+            # Step 3: Final save of all holders
+            self.save_holders(holders_data)
+            print(f"\n\n{Colors.GREEN}✅ Collected holders from {len(holders_data)} tokens ({len(unique_wallets)} unique wallets){Colors.ENDC}")
+        
+        async def collect_traders():
+            nonlocal traders_by_token
+            print(f"\n{_H_BOLD_CYAN}Collecting top traders from Birdeye...{Colors.ENDC}\n")
+            trader_pending = [(i, token['tokenAddress']) for i, token in enumerate(tokens) if token.get('tokenAddress')]
+            traders_by_token = await self._collect_traders_async(client, birdeye_limiter, trader_pending, all_trader_wallets,
+                                                                 on_wallets=enqueue_wallets, on_progress=collector_progress("Traders"))
         
-        # Step 3: Final save of all holders
-        self.save_holders(holders_data)
-        print(f"\n\n{Colors.GREEN}✅ Collected holders from {len(holders_data)} tokens ({len(set(h['ownerAddress'] for t in holders_data.values() for h in t))} unique wallets){Colors.ENDC}")
+        # Token buckets for this run's event loop (auto-loop mode starts a new loop each cycle)
+        moralis_limiter = AsyncLimiter(self.moralis_rps, 1)
+        birdeye_limiter = AsyncLimiter(self.birdeye_rps, 1)
         
-        # Step 3.5: Fetch top traders if enabled
+        try:
+            # One HTTP/2 client for the holders and traders phases, which run side by side
+            async with self._new_http_client() as client:
+                phases = [collect_holders()]
+                # Step 3.5: Fetch top traders if enabled
+                if fetch_traders:
+                    phases.append(collect_traders())
+                await asyncio.gather(*phases)
+        finally:
+            # Tell the analyzer pages that no more wallets are coming
+            wallet_queue.put_nowait(None)
+        
+        # Add trader wallets to owner_addresses.txt (merge with holders)
         if fetch_traders:
-            print(f"\n{Colors.BOLD}{Colors.CYAN}Collecting top traders from Birdeye...{Colors.ENDC}\n")
-            
-            # Collect all trader wallets from all tokens
-            all_trader_wallets = set()
-            traders_fetched = 0
-            
-            for i, token in enumerate(tokens):
-                token_address = token.get('tokenAddress')
-                if not token_address:
-                    continue
-                
-                print(f"\r{Colors.CYAN}Fetching traders {i+1}/{len(tokens)}: {token_address[:8]}...{token_address[-8:]} {Colors.YELLOW}Please wait...{Colors.ENDC}", end='', flush=True)
-                
-                traders = self.fetch_top_traders(token_address)
-                
-                if traders:
-                    traders_fetched += 1
-                    for trader in traders:
-                        owner = trader.get('owner')
-                        if owner:
-                            all_trader_wallets.add(owner)
-                    print(f"\r{Colors.CYAN}Fetched traders {i+1}/{len(tokens)}: {token_address[:8]}...{token_address[-8:]} {Colors.GREEN}✅ {len(traders)} traders | Total trader wallets: {len(all_trader_wallets)}{Colors.ENDC}")
-                else:
-                    print(f"\r{Colors.CYAN}Fetched traders {i+1}/{len(tokens)}: {token_address[:8]}...{token_address[-8:]} {Colors.RED}❌ No data{Colors.ENDC}")
-                
-                # Add delay between requests to avoid rate limits
-                if i < len(tokens) - 1:
-                    time.sleep(random.uniform(1.0, 2.0))
-            
-            # Add trader wallets to owner_addresses.txt (merge with holders)
             if all_trader_wallets:
-                print(f"\n{Colors.GREEN}✅ Collected {len(all_trader_wallets)} unique trader wallets from {traders_fetched} tokens{Colors.ENDC}")
+                print(f"\n{Colors.GREEN}✅ Collected {len(all_trader_wallets)} unique trader wallets from {len(traders_by_token)} tokens{Colors.ENDC}")
                 print(f"{Colors.CYAN}Merging traders with holders...{Colors.ENDC}")
                 
                 # Read existing holders
@@ -639,294 +1021,368 @@ class SolanaTokenOrchestrator:
                 combined_wallets = existing_wallets.union(all_trader_wallets)
                 
                 # Save combined list
-                with open(self.owner_addresses_file, 'w') as f:
-                    for wallet in sorted(combined_wallets):
-                        f.write(f"{wallet}\n")
+                _write_lines(self.owner_addresses_file, sorted(combined_wallets))
                 
                 added_count = len(all_trader_wallets - existing_wallets)
                 print(f"{Colors.GREEN}✅ Added {added_count} new trader wallets to analysis list (Total: {len(combined_wallets)}){Colors.ENDC}")
             else:
                 print(f"\n{Colors.YELLOW}⚠️  No trader wallets found{Colors.ENDC}")
         
-        # Step 4: Run Playwright Analysis
-        print(f"\n{Colors.BOLD}{Colors.GREEN}✅ Token collection complete!{Colors.ENDC}\n")
-        logger.info("Token collection complete. Starting wallet analysis phase...")
-        self.run_dexcheck_analysis()
+        print(f"\n{_H_BOLD_GREEN}✅ Token collection complete!{Colors.ENDC}\n")
+        logger.info("Token collection complete. Waiting for wallet analysis to finish...")
+        try:
+            results = await analysis_task
+            draw_progress(final=True)
+        except (RuntimeError, OSError, asyncio.TimeoutError) as e:
+            # The analyzer reports its own failures in the result dict; only
+            # format a full traceback when debugging
+            logger.error("Playwright analysis error: %r", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                import traceback
+                logger.debug(traceback.format_exc())
+            return
+        self._report_analysis_results(results)
         
         logger.info("Complete workflow finished successfully!")
         print("PROGRESS: Analysis complete", flush=True)
-        logger.info(f"Output files created/updated:")
-        logger.info(f"  - {self.tokens_file}: Token information")
-        logger.info(f"  - {self.tokens_txt}: Token addresses only")
-        logger.info(f"  - {self.holders_file}: Full holders data")
-        logger.info(f"  - {self.holders_txt}: Holder addresses only")
-        logger.info(f"  - {self.owner_addresses_file}: Compatible holder addresses")
-        logger.info(f"  - {self.good_wallets_file}: Profitable wallets found (JSON)")
-        logger.info(f"  - {self.good_wallets_txt}: Profitable wallets found (TXT)")
+        logger.info("Output files created/updated:")
+        logger.info("  - %s: Token information", self.tokens_file)
+        logger.info("  - %s: Token addresses only", self.tokens_txt)
+        logger.info("  - %s: Full holders data", self.holders_file)
+        logger.info("  - %s: Holder addresses only", self.holders_txt)
+        logger.info("  - %s: Compatible holder addresses", self.owner_addresses_file)
+        logger.info("  - %s: Profitable wallets found (JSON)", self.good_wallets_file)
+        logger.info("  - %s: Profitable wallets found (TXT)", self.good_wallets_txt)
 
-def print_banner():
-    """Print beautiful startup banner"""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'=' * 80}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.CYAN}🚀 SOLANA TOKEN & WALLET ANALYSIS ORCHESTRATOR 🚀{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'=' * 80}{Colors.ENDC}")
-    print(f"{Colors.BOLD}Powered by Playwright Multi-Page Concurrent Scanner{Colors.ENDC}")
-    print(f"{Colors.CYAN}Version 2.1 - Fast, Beautiful, Intelligent{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'=' * 80}{Colors.ENDC}\n")
+# Files removed by clean_restart, by directory
+CLEAN_TARGETS_DATA = frozenset({
+    'tokens.json', 'tokens.txt',
+    'holders.json', 'holders.jsonl', 'holders.txt',
+    'owner_addresses.txt',
+    'good_wallets.json', 'good_wallets.txt',
+    'scanned_wallets.txt',
+})
+CLEAN_TARGETS_LOGS = frozenset({'orchestrator.log'})
 
-def clean_restart():
-    """Delete all data files for a clean restart"""
-    print(f"\n{Colors.BOLD}{Colors.RED}🗑️  CLEAN RESTART{Colors.ENDC}")
-    print(f"{Colors.RED}{'=' * 80}{Colors.ENDC}")
-    print(f"{Colors.YELLOW}⚠️  This will delete ALL data files:{Colors.ENDC}")
-    print(f"   - tokens.json, tokens.txt")
-    print(f"   - holders.json, holders.txt")
-    print(f"   - owner_addresses.txt")
-    print(f"   - good_wallets.json, good_wallets.txt")
-    print(f"   - scanned_wallets.txt")
-    print(f"   - orchestrator.log")
-    print(f"{Colors.RED}{'=' * 80}{Colors.ENDC}\n")
+# Static part of the clean-restart prompt, built once at import
+_CLEAN_RESTART_NOTICE = "\n".join((
+    f"\n{_H_BOLD_RED}🗑️  CLEAN RESTART{Colors.ENDC}",
+    _SEP80_RED,
+    f"{Colors.YELLOW}⚠️  This will delete ALL data files:{Colors.ENDC}",
+    "   - tokens.json, tokens.txt",
+    "   - holders.json, holders.jsonl, holders.txt",
+    "   - owner_addresses.txt",
+    "   - good_wallets.json, good_wallets.txt",
+    "   - scanned_wallets.txt",
+    "   - api_cache/",
+    "   - orchestrator.log",
+    f"{_SEP80_RED}\n",
+))
+
+_YES = frozenset({sys.intern('y'), sys.intern('yes')})
+_YES_CONFIRM = frozenset({sys.intern('yes')})
+
+def _ask_yn(prompt: str, default: bool = False, accept: frozenset = _YES, ask=input) -> bool:
+    """Ask a yes/no question; an empty answer returns default"""
+    answer = ask(prompt).strip().lower()
+    if not answer:
+        return default
+    return answer in accept
+
+class _Out:
+    """
+    Buffers interactive menu output and writes it to stdout in one call,
+    right before each input() prompt and when the block exits.
+    """
+    def __init__(self):
+        self.buf = io.StringIO()
     
-    confirm = input(f"{Colors.BOLD}{Colors.RED}Are you SURE you want to delete all data? (type 'yes' to confirm): {Colors.ENDC}").strip()
-    if confirm.lower() != 'yes':
-        print(f"{Colors.GREEN}✓ Clean restart cancelled{Colors.ENDC}\n")
-        return False
+    def __enter__(self):
+        return self
     
-    # Use organized structure paths
-    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-    logs_dir = os.path.join(os.path.dirname(__file__), '..', 'logs')
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
     
-    files_to_delete = [
-        os.path.join(data_dir, 'tokens.json'),
-        os.path.join(data_dir, 'tokens.txt'),
-        os.path.join(data_dir, 'holders.json'),
-        os.path.join(data_dir, 'holders.txt'),
-        os.path.join(data_dir, 'owner_addresses.txt'),
-        os.path.join(data_dir, 'good_wallets.json'),
-        os.path.join(data_dir, 'good_wallets.txt'),
-        os.path.join(data_dir, 'scanned_wallets.txt'),
-        os.path.join(logs_dir, 'orchestrator.log')
-    ]
+    def print(self, text: str = ""):
+        self.buf.write(text)
+        self.buf.write("\n")
     
-    deleted_count = 0
-    for filepath in files_to_delete:
-        if os.path.exists(filepath):
-            try:
-                os.remove(filepath)
-                print(f"{Colors.GREEN}✓ Deleted: {os.path.basename(filepath)}{Colors.ENDC}")
-                deleted_count += 1
-            except Exception as e:
-                print(f"{Colors.RED}❌ Failed to delete {os.path.basename(filepath)}: {e}{Colors.ENDC}")
+    def flush(self):
+        data = self.buf.getvalue()
+        if data:
+            sys.stdout.write(data)
+            sys.stdout.flush()
+            self.buf.seek(0)
+            self.buf.truncate()
     
-    print(f"\n{Colors.GREEN}✅ Clean restart complete! Deleted {deleted_count} files.{Colors.ENDC}\n")
-    return True
+    def input(self, prompt: str) -> str:
+        self.flush()
+        return input(prompt)
 
-def get_user_input():
-    """Interactive menu to get user configuration"""
-    print(f"{Colors.BOLD}{Colors.CYAN}📋 CONFIGURATION MENU{Colors.ENDC}")
-    print(f"{Colors.CYAN}{'=' * 80}{Colors.ENDC}\n")
-    
-    # Clean restart option
-    print(f"{Colors.BOLD}0. Clean Restart?{Colors.ENDC}")
-    print(f"   {Colors.CYAN}(Delete all data files and start fresh){Colors.ENDC}")
-    clean = input(f"   {Colors.YELLOW}Clean restart? (y/n) [default: n]: {Colors.ENDC}").strip().lower()
-    if clean == 'y':
-        if clean_restart():
-            print(f"{Colors.GREEN}✓ Starting with clean slate{Colors.ENDC}\n")
-        else:
-            print(f"{Colors.YELLOW}✓ Keeping existing data{Colors.ENDC}\n")
-    else:
-        print(f"   {Colors.GREEN}✓ Keeping existing data{Colors.ENDC}\n")
-    
-    # Token Source
-    while True:
-        print(f"{Colors.BOLD}1. Which token source to use?{Colors.ENDC}")
-        print(f"   {Colors.CYAN}1. Moralis (PumpFun Graduated){Colors.ENDC}")
-        print(f"   {Colors.CYAN}2. Birdeye (Liquidity-based){Colors.ENDC}")
-        source = input(f"   {Colors.YELLOW}Enter choice [default: 2]: {Colors.ENDC}").strip()
-        if source == '1':
-            token_source = 'moralis'
-            print(f"   {Colors.GREEN}✓ Token Source: Moralis{Colors.ENDC}\n")
-            break
-        elif source in ['', '2']:
-            token_source = 'birdeye'
-            print(f"   {Colors.GREEN}✓ Token Source: Birdeye{Colors.ENDC}\n")
-            break
-        else:
-            print(f"   {Colors.RED}❌ Invalid input. Please enter 1 or 2.{Colors.ENDC}\n")
+_BANNER = "\n".join((
+    f"\n{_SEP80_BOLD_CYAN}",
+    f"{_H_BOLD_CYAN}🚀 SOLANA TOKEN & WALLET ANALYSIS ORCHESTRATOR 🚀{Colors.ENDC}",
+    _SEP80_BOLD_CYAN,
+    f"{Colors.BOLD}Powered by Playwright Multi-Page Concurrent Scanner{Colors.ENDC}",
+    f"{Colors.CYAN}Version 2.1 - Fast, Beautiful, Intelligent{Colors.ENDC}",
+    f"{_SEP80_BOLD_CYAN}\n",
+    "",
+))
 
-    # Token limit
-    while True:
-        try:
-            print(f"{Colors.BOLD}2. How many tokens to fetch?{Colors.ENDC}")
-            print(f"   {Colors.CYAN}(Recommended: 50-100, Max: 1000){Colors.ENDC}")
-            token_limit = input(f"   {Colors.YELLOW}Enter value [default: 100]: {Colors.ENDC}").strip()
-            token_limit = int(token_limit) if token_limit else 100
-            if token_limit < 1:
-                print(f"   {Colors.RED}❌ Must be at least 1{Colors.ENDC}\n")
-                continue
-            if token_limit > 1000:
-                print(f"   {Colors.YELLOW}⚠️  Large value! This will take a long time.{Colors.ENDC}")
-                confirm = input(f"   Continue? (y/n): ").strip().lower()
-                if confirm != 'y':
-                    continue
-            print(f"   {Colors.GREEN}✓ Token limit: {token_limit}{Colors.ENDC}\n")
-            break
-        except ValueError:
-            print(f"   {Colors.RED}❌ Invalid input. Please enter a number.{Colors.ENDC}\n")
-    
-    # Number of pages
-    while True:
-        try:
-            print(f"{Colors.BOLD}3. How many concurrent browser pages for scanning?{Colors.ENDC}")
-            print(f"   {Colors.CYAN}(More pages = faster, but uses more memory){Colors.ENDC}")
-            print(f"   {Colors.CYAN}Recommended: 3-5 for most systems, 7-10 for powerful PCs{Colors.ENDC}")
-            num_pages = input(f"   {Colors.YELLOW}Enter value [default: 3]: {Colors.ENDC}").strip()
-            num_pages = int(num_pages) if num_pages else 3
-            if num_pages < 1:
-                print(f"   {Colors.RED}❌ Must be at least 1{Colors.ENDC}\n")
-                continue
-            if num_pages > 10:
-                print(f"   {Colors.YELLOW}⚠️  High page count may cause performance issues{Colors.ENDC}")
-                confirm = input(f"   Continue? (y/n): ").strip().lower()
-                if confirm != 'y':
-                    continue
-            print(f"   {Colors.GREEN}✓ Concurrent pages: {num_pages}{Colors.ENDC}\n")
-            break
-        except ValueError:
-            print(f"   {Colors.RED}❌ Invalid input. Please enter a number.{Colors.ENDC}\n")
-    
-    # Win rate
-    while True:
-        try:
-            print(f"{Colors.BOLD}4. Minimum Win Rate (percentage)?{Colors.ENDC}")
-            print(f"   {Colors.CYAN}(Higher = stricter filtering, fewer results){Colors.ENDC}")
-            print(f"   {Colors.CYAN}Examples: 85=strict, 70=moderate, 60=relaxed, 0=all{Colors.ENDC}")
-            min_winrate = input(f"   {Colors.YELLOW}Enter value [default: 70]: {Colors.ENDC}").strip()
-            min_winrate = float(min_winrate) if min_winrate else 70.0
-            if min_winrate < 0 or min_winrate > 100:
-                print(f"   {Colors.RED}❌ Must be between 0 and 100{Colors.ENDC}\n")
+def print_banner():
+    """Print beautiful startup banner"""
+    sys.stdout.write(_BANNER)
+    sys.stdout.flush()
+
+def clean_restart():
+    """Delete all data files for a clean restart"""
+    with _Out() as out:
+        out.print(_CLEAN_RESTART_NOTICE)
+        
+        if not _ask_yn(f"{_H_BOLD_RED}Are you SURE you want to delete all data? (type 'yes' to confirm): {Colors.ENDC}",
+                       accept=_YES_CONFIRM, ask=out.input):
+            out.print(f"{Colors.GREEN}✓ Clean restart cancelled{Colors.ENDC}\n")
+            return False
+        
+        # One directory listing per folder instead of an exists() check per file
+        deleted_count = 0
+        for directory, targets in ((_DATA_DIR, CLEAN_TARGETS_DATA), (_LOGS_DIR, CLEAN_TARGETS_LOGS)):
+            try:
+                with os.scandir(directory) as entries:
+                    matches = [entry for entry in entries if entry.name in targets]
+            except FileNotFoundError:
                 continue
-            print(f"   {Colors.GREEN}✓ Min Win Rate: {min_winrate}%{Colors.ENDC}\n")
-            break
-        except ValueError:
-            print(f"   {Colors.RED}❌ Invalid input. Please enter a number.{Colors.ENDC}\n")
+            
+            for entry in matches:
+                try:
+                    os.unlink(entry.path)
+                    out.print(f"{Colors.GREEN}✓ Deleted: {entry.name}{Colors.ENDC}")
+                    deleted_count += 1
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    out.print(f"{Colors.RED}❌ Failed to delete {entry.name}: {e}{Colors.ENDC}")
+        
+        # Cached API responses live in their own directory
+        if os.path.isdir(API_CACHE_DIR):
+            import shutil
+            try:
+                shutil.rmtree(API_CACHE_DIR)
+                out.print(f"{Colors.GREEN}✓ Deleted: api_cache/{Colors.ENDC}")
+                deleted_count += 1
+            except OSError as e:
+                out.print(f"{Colors.RED}❌ Failed to delete api_cache/: {e}{Colors.ENDC}")
+        
+        out.print(f"\n{Colors.GREEN}✅ Clean restart complete! Deleted {deleted_count} files.{Colors.ENDC}\n")
+        return True
+
+_INVALID_NUMBER = f"   {Colors.RED}❌ Invalid input. Please enter a number.{Colors.ENDC}\n"
+
+def _prompt_num(out: _Out, title: str, hints: List[str], prompt: str, default, cast=int,
+                check=None, caution=None, repeat_header: bool = True, title_prefix: str = ""):
+    """
+    Ask for a number until an acceptable one is entered; empty input gives
+    default. check(value) returns an error message for invalid values and
+    caution(value) a warning the user has to confirm with 'y'.
+    """
+    header = [f"{title_prefix}{Colors.BOLD}{title}{Colors.ENDC}"] + [f"   {Colors.CYAN}{hint}{Colors.ENDC}" for hint in hints]
+    prompt = f"   {Colors.YELLOW}{prompt}: {Colors.ENDC}"
     
-    # Realized PnL
+    show_header = True
     while True:
-        try:
-            print(f"{Colors.BOLD}5. Minimum Realized PnL (return percentage)?{Colors.ENDC}")
-            print(f"   {Colors.CYAN}(This is return %, not dollars){Colors.ENDC}")
-            print(f"   {Colors.CYAN}Examples: 200=3x return, 100=2x return, 50=1.5x return, 0=any{Colors.ENDC}")
-            min_pnl = input(f"   {Colors.YELLOW}Enter value [default: 100]: {Colors.ENDC}").strip()
-            min_pnl = float(min_pnl) if min_pnl else 100.0
-            if min_pnl < -100:
-                print(f"   {Colors.RED}❌ Value too low (minimum -100%){Colors.ENDC}\n")
+        if show_header:
+            for line in header:
+                out.print(line)
+            show_header = repeat_header
+        
+        raw = out.input(prompt).strip()
+        if not raw:
+            value = default
+        else:
+            try:
+                value = cast(raw)
+            except ValueError:
+                out.print(_INVALID_NUMBER)
                 continue
-            print(f"   {Colors.GREEN}✓ Min Realized PnL: {min_pnl}%{Colors.ENDC}\n")
-            break
-        except ValueError:
-            print(f"   {Colors.RED}❌ Invalid input. Please enter a number.{Colors.ENDC}\n")
-    
-    # Fetch top traders option
-    print(f"{Colors.BOLD}6. Fetch top traders for each token?{Colors.ENDC}")
-    print(f"   {Colors.CYAN}(This will fetch top performing traders from Birdeye API){Colors.ENDC}")
-    print(f"   {Colors.CYAN}(Traders will be added to the wallet analysis list){Colors.ENDC}")
-    fetch_traders = input(f"   {Colors.YELLOW}Fetch top traders? (y/n) [default: n]: {Colors.ENDC}").strip().lower()
-    if fetch_traders == 'y':
-        print(f"   {Colors.GREEN}✓ Top traders fetching: ENABLED{Colors.ENDC}\n")
-    else:
-        print(f"   {Colors.GREEN}✓ Top traders fetching: DISABLED{Colors.ENDC}\n")
-    
-    # Resume option
-    print(f"{Colors.BOLD}7. Resume from a specific token?{Colors.ENDC}")
-    print(f"   {Colors.CYAN}(Leave empty to start from beginning){Colors.ENDC}")
-    while True:
-        try:
-            resume_from = input(f"   {Colors.YELLOW}Enter token number to resume from [default: 1]: {Colors.ENDC}").strip()
-            resume_from = int(resume_from) if resume_from else 0
-            if resume_from < 0:
-                print(f"   {Colors.RED}❌ Must be 0 or greater{Colors.ENDC}\n")
+        
+        error = check(value) if check else None
+        if error:
+            out.print(f"   {Colors.RED}❌ {error}{Colors.ENDC}\n")
+            continue
+        
+        warning = caution(value) if caution else None
+        if warning:
+            out.print(f"   {Colors.YELLOW}⚠️  {warning}{Colors.ENDC}")
+            if not _ask_yn("   Continue? (y/n): ", ask=out.input):
                 continue
-            if resume_from > 0:
-                print(f"   {Colors.GREEN}✓ Resuming from token {resume_from}{Colors.ENDC}\n")
+        
+        return value
+
+def _prompt_yn(out: _Out, title: str, hints: List[str], question: str) -> bool:
+    """Numbered menu yes/no question, defaulting to no"""
+    out.print(f"{Colors.BOLD}{title}{Colors.ENDC}")
+    for hint in hints:
+        out.print(f"   {Colors.CYAN}{hint}{Colors.ENDC}")
+    return _ask_yn(f"   {Colors.YELLOW}{question} (y/n) [default: n]: {Colors.ENDC}", ask=out.input)
+
+def get_user_input():
+    """Interactive menu to get user configuration"""
+    with _Out() as out:
+        out.print(f"{_H_BOLD_CYAN}📋 CONFIGURATION MENU{Colors.ENDC}")
+        out.print(f"{_SEP80_CYAN}\n")
+        
+        if _prompt_yn(out, "0. Clean Restart?", ["(Delete all data files and start fresh)"], "Clean restart?"):
+            if clean_restart():
+                out.print(f"{Colors.GREEN}✓ Starting with clean slate{Colors.ENDC}\n")
             else:
-                print(f"   {Colors.GREEN}✓ Starting from beginning{Colors.ENDC}\n")
-            break
-        except ValueError:
-            print(f"   {Colors.RED}❌ Invalid input. Please enter a number.{Colors.ENDC}\n")
-    
-    # Auto-loop option
-    print(f"{Colors.BOLD}8. Auto-loop mode?{Colors.ENDC}")
-    print(f"   {Colors.CYAN}(Automatically restart and run again after each completion){Colors.ENDC}")
-    auto_loop = input(f"   {Colors.YELLOW}Enable auto-loop? (y/n) [default: n]: {Colors.ENDC}").strip().lower()
-    
-    loop_interval_minutes = 0
-    if auto_loop == 'y':
+                out.print(f"{Colors.YELLOW}✓ Keeping existing data{Colors.ENDC}\n")
+        else:
+            out.print(f"   {Colors.GREEN}✓ Keeping existing data{Colors.ENDC}\n")
+        
+        # Token Source
         while True:
-            try:
-                print(f"\n   {Colors.BOLD}How often to run (in minutes)?{Colors.ENDC}")
-                print(f"   {Colors.CYAN}Examples: 60=1 hour, 120=2 hours, 300=5 hours, 600=10 hours{Colors.ENDC}")
-                interval = input(f"   {Colors.YELLOW}Enter interval in minutes [default: 60]: {Colors.ENDC}").strip()
-                loop_interval_minutes = int(interval) if interval else 60
-                if loop_interval_minutes < 1:
-                    print(f"   {Colors.RED}❌ Must be at least 1 minute{Colors.ENDC}\n")
-                    continue
-                if loop_interval_minutes < 30:
-                    print(f"   {Colors.YELLOW}⚠️  Very short interval! This may cause high server load.{Colors.ENDC}")
-                    confirm = input(f"   Continue? (y/n): ").strip().lower()
-                    if confirm != 'y':
-                        continue
-                hours = loop_interval_minutes / 60
-                print(f"   {Colors.GREEN}✓ Auto-loop enabled: every {loop_interval_minutes} minutes ({hours:.1f} hours){Colors.ENDC}\n")
+            out.print(f"{Colors.BOLD}1. Which token source to use?{Colors.ENDC}")
+            out.print(f"   {Colors.CYAN}1. Moralis (PumpFun Graduated){Colors.ENDC}")
+            out.print(f"   {Colors.CYAN}2. Birdeye (Liquidity-based){Colors.ENDC}")
+            source = out.input(f"   {Colors.YELLOW}Enter choice [default: 2]: {Colors.ENDC}").strip()
+            if source == '1':
+                token_source = 'moralis'
+                out.print(f"   {Colors.GREEN}✓ Token Source: Moralis{Colors.ENDC}\n")
                 break
-            except ValueError:
-                print(f"   {Colors.RED}❌ Invalid input. Please enter a number.{Colors.ENDC}\n")
-    else:
-        print(f"   {Colors.GREEN}✓ Auto-loop disabled (run once){Colors.ENDC}\n")
-    
-    # Summary
-    print(f"{Colors.BOLD}{Colors.CYAN}{'=' * 80}{Colors.ENDC}")
-    print(f"{Colors.BOLD}📊 CONFIGURATION SUMMARY:{Colors.ENDC}")
-    print(f"{Colors.CYAN}{'=' * 80}{Colors.ENDC}")
-    print(f"  🪙 Tokens to fetch: {Colors.YELLOW}{token_limit}{Colors.ENDC}")
-    print(f"  📊 Token Source: {Colors.YELLOW}{token_source.upper()}{Colors.ENDC}")
-    print(f"  🎭 Concurrent pages: {Colors.YELLOW}{num_pages}{Colors.ENDC}")
-    print(f"  🎯 Min Win Rate: {Colors.YELLOW}{min_winrate}%{Colors.ENDC}")
-    print(f"  💰 Min Realized PnL: {Colors.YELLOW}{min_pnl}%{Colors.ENDC} (return %)")
-    if fetch_traders == 'y':
-        print(f"  🏆 Top Traders: {Colors.GREEN}ENABLED{Colors.ENDC} (fetching from Birdeye)")
-    else:
-        print(f"  🏆 Top Traders: {Colors.YELLOW}DISABLED{Colors.ENDC}")
-    if resume_from > 0:
-        print(f"  📍 Resume from: {Colors.YELLOW}Token {resume_from}{Colors.ENDC}")
-    print(f"  ✅ Duplicate prevention: {Colors.GREEN}ENABLED{Colors.ENDC} (won't scan same wallet twice)")
-    if loop_interval_minutes > 0:
-        hours = loop_interval_minutes / 60
-        print(f"  🔁 Auto-loop: {Colors.GREEN}ENABLED{Colors.ENDC} (every {loop_interval_minutes} min / {hours:.1f} hrs)")
-    else:
-        print(f"  🔁 Auto-loop: {Colors.YELLOW}DISABLED{Colors.ENDC} (run once)")
-    print(f"{Colors.CYAN}{'=' * 80}{Colors.ENDC}\n")
-    
-    confirm = input(f"{Colors.BOLD}Proceed with this configuration? (y/n): {Colors.ENDC}").strip().lower()
-    if confirm != 'y':
-        print(f"\n{Colors.YELLOW}Configuration cancelled. Exiting...{Colors.ENDC}\n")
-        sys.exit(0)
-    
-    print(f"\n{Colors.GREEN}✅ Configuration confirmed! Starting workflow...{Colors.ENDC}\n")
-    
-    return {
-        'token_limit': token_limit,
-        'num_pages': num_pages,
-        'min_winrate': min_winrate,
-        'min_pnl': min_pnl,
-        'token_source': token_source,
-        'fetch_traders': fetch_traders == 'y',
-        'resume_from': resume_from,
-        'auto_loop': loop_interval_minutes > 0,
-        'loop_interval_minutes': loop_interval_minutes
-    }
+            elif source in ['', '2']:
+                token_source = 'birdeye'
+                out.print(f"   {Colors.GREEN}✓ Token Source: Birdeye{Colors.ENDC}\n")
+                break
+            else:
+                out.print(f"   {Colors.RED}❌ Invalid input. Please enter 1 or 2.{Colors.ENDC}\n")
+
+        token_limit = _prompt_num(
+            out, "2. How many tokens to fetch?", ["(Recommended: 50-100, Max: 1000)"],
+            "Enter value [default: 100]", 100,
+            check=lambda v: "Must be at least 1" if v < 1 else None,
+            caution=lambda v: "Large value! This will take a long time." if v > 1000 else None
+        )
+        out.print(f"   {Colors.GREEN}✓ Token limit: {token_limit}{Colors.ENDC}\n")
+        
+        num_pages = _prompt_num(
+            out, "3. How many concurrent browser pages for scanning?",
+            ["(More pages = faster, but uses more memory)", "Recommended: 3-5 for most systems, 7-10 for powerful PCs"],
+            "Enter value [default: 3]", 3,
+            check=lambda v: "Must be at least 1" if v < 1 else None,
+            caution=lambda v: "High page count may cause performance issues" if v > 10 else None
+        )
+        out.print(f"   {Colors.GREEN}✓ Concurrent pages: {num_pages}{Colors.ENDC}\n")
+        
+        min_winrate = _prompt_num(
+            out, "4. Minimum Win Rate (percentage)?",
+            ["(Higher = stricter filtering, fewer results)", "Examples: 85=strict, 70=moderate, 60=relaxed, 0=all"],
+            "Enter value [default: 70]", 70.0, cast=float,
+            check=lambda v: "Must be between 0 and 100" if v < 0 or v > 100 else None
+        )
+        out.print(f"   {Colors.GREEN}✓ Min Win Rate: {min_winrate}%{Colors.ENDC}\n")
+        
+        min_pnl = _prompt_num(
+            out, "5. Minimum Realized PnL (return percentage)?",
+            ["(This is return %, not dollars)", "Examples: 200=3x return, 100=2x return, 50=1.5x return, 0=any"],
+            "Enter value [default: 100]", 100.0, cast=float,
+            check=lambda v: "Value too low (minimum -100%)" if v < -100 else None
+        )
+        out.print(f"   {Colors.GREEN}✓ Min Realized PnL: {min_pnl}%{Colors.ENDC}\n")
+        
+        fetch_traders = _prompt_yn(
+            out, "6. Fetch top traders for each token?",
+            ["(This will fetch top performing traders from Birdeye API)", "(Traders will be added to the wallet analysis list)"],
+            "Fetch top traders?"
+        )
+        out.print(f"   {Colors.GREEN}✓ Top traders fetching: {'ENABLED' if fetch_traders else 'DISABLED'}{Colors.ENDC}\n")
+        
+        resume_from = _prompt_num(
+            out, "7. Resume from a specific token?", ["(Leave empty to start from beginning)"],
+            "Enter token number to resume from [default: 1]", 0,
+            check=lambda v: "Must be 0 or greater" if v < 0 else None,
+            repeat_header=False
+        )
+        if resume_from > 0:
+            out.print(f"   {Colors.GREEN}✓ Resuming from token {resume_from}{Colors.ENDC}\n")
+        else:
+            out.print(f"   {Colors.GREEN}✓ Starting from beginning{Colors.ENDC}\n")
+        
+        auto_loop = _prompt_yn(
+            out, "8. Auto-loop mode?", ["(Automatically restart and run again after each completion)"],
+            "Enable auto-loop?"
+        )
+        
+        loop_interval_minutes = 0
+        if auto_loop:
+            loop_interval_minutes = _prompt_num(
+                out, "How often to run (in minutes)?", ["Examples: 60=1 hour, 120=2 hours, 300=5 hours, 600=10 hours"],
+                "Enter interval in minutes [default: 60]", 60,
+                check=lambda v: "Must be at least 1 minute" if v < 1 else None,
+                caution=lambda v: "Very short interval! This may cause high server load." if v < 30 else None,
+                title_prefix="\n   "
+            )
+            hours = loop_interval_minutes / 60
+            out.print(f"   {Colors.GREEN}✓ Auto-loop enabled: every {loop_interval_minutes} minutes ({hours:.1f} hours){Colors.ENDC}\n")
+        else:
+            out.print(f"   {Colors.GREEN}✓ Auto-loop disabled (run once){Colors.ENDC}\n")
+        
+        # Summary, assembled as one block
+        lines = [
+            _SEP80_BOLD_CYAN,
+            f"{Colors.BOLD}📊 CONFIGURATION SUMMARY:{Colors.ENDC}",
+            _SEP80_CYAN,
+            f"  🪙 Tokens to fetch: {Colors.YELLOW}{token_limit}{Colors.ENDC}",
+            f"  📊 Token Source: {Colors.YELLOW}{token_source.upper()}{Colors.ENDC}",
+            f"  🎭 Concurrent pages: {Colors.YELLOW}{num_pages}{Colors.ENDC}",
+            f"  🎯 Min Win Rate: {Colors.YELLOW}{min_winrate}%{Colors.ENDC}",
+            f"  💰 Min Realized PnL: {Colors.YELLOW}{min_pnl}%{Colors.ENDC} (return %)",
+        ]
+        if fetch_traders:
+            lines.append(f"  🏆 Top Traders: {Colors.GREEN}ENABLED{Colors.ENDC} (fetching from Birdeye)")
+        else:
+            lines.append(f"  🏆 Top Traders: {Colors.YELLOW}DISABLED{Colors.ENDC}")
+        if resume_from > 0:
+            lines.append(f"  📍 Resume from: {Colors.YELLOW}Token {resume_from}{Colors.ENDC}")
+        lines.append(f"  ✅ Duplicate prevention: {Colors.GREEN}ENABLED{Colors.ENDC} (won't scan same wallet twice)")
+        if loop_interval_minutes > 0:
+            hours = loop_interval_minutes / 60
+            lines.append(f"  🔁 Auto-loop: {Colors.GREEN}ENABLED{Colors.ENDC} (every {loop_interval_minutes} min / {hours:.1f} hrs)")
+        else:
+            lines.append(f"  🔁 Auto-loop: {Colors.YELLOW}DISABLED{Colors.ENDC} (run once)")
+        lines.append(f"{_SEP80_CYAN}\n")
+        out.print("\n".join(lines))
+        
+        if not _ask_yn(f"{Colors.BOLD}Proceed with this configuration? (y/n): {Colors.ENDC}", ask=out.input):
+            out.print(f"\n{Colors.YELLOW}Configuration cancelled. Exiting...{Colors.ENDC}\n")
+            sys.exit(0)
+        
+        out.print(f"\n{Colors.GREEN}✅ Configuration confirmed! Starting workflow...{Colors.ENDC}\n")
+        
+        return {
+            'token_limit': token_limit,
+            'num_pages': num_pages,
+            'min_winrate': min_winrate,
+            'min_pnl': min_pnl,
+            'token_source': token_source,
+            'fetch_traders': fetch_traders,
+            'resume_from': resume_from,
+            'auto_loop': loop_interval_minutes > 0,
+            'loop_interval_minutes': loop_interval_minutes
+        }
+
+def _wait_interruptible(seconds: float) -> bool:
+    """Wait between auto-loop runs; returns True if Ctrl+C was pressed meanwhile"""
+    stop = threading.Event()
+    # Only swap the SIGINT handler for the wait so Ctrl+C mid-run still raises KeyboardInterrupt
+    previous = signal.signal(signal.SIGINT, lambda *_: stop.set())
+    try:
+        return stop.wait(seconds)
+    finally:
+        signal.signal(signal.SIGINT, previous)
 
 def main():
+    import argparse  # only needed for the CLI entry point
+    
     parser = argparse.ArgumentParser(
         description="🚀 Solana Token and Wallet Analysis Orchestrator with Playwright Scanner",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1013,7 +1469,8 @@ def main():
         clean_restart()
     
     # Interactive mode or command-line mode
-    if not args.non_interactive and not any([args.limit, args.pages, args.min_winrate, args.min_pnl, args.resume > 0, args.loop, args.token_source != 'birdeye']):
+    if not args.non_interactive and not (args.limit or args.pages or args.min_winrate or args.min_pnl
+                                         or args.resume > 0 or args.loop or args.token_source != 'birdeye'):
         # Interactive mode - get user input
         config = get_user_input()
         token_limit = config['token_limit']
@@ -1044,8 +1501,7 @@ def main():
         
         if num_pages > 10:
             print(f"{Colors.YELLOW}⚠️  Warning: Using more than 10 pages may cause performance issues{Colors.ENDC}")
-            response = input("Continue? (y/n): ")
-            if response.lower() != 'y':
+            if not _ask_yn("Continue? (y/n): "):
                 return
     
     # Create orchestrator with parameters
@@ -1057,7 +1513,8 @@ def main():
     )
     
     # Print configuration if not already shown
-    if args.non_interactive or any([args.limit, args.pages, args.min_winrate, args.min_pnl, args.resume > 0, args.loop]):
+    if args.non_interactive or (args.limit or args.pages or args.min_winrate or args.min_pnl
+                                or args.resume > 0 or args.loop):
         print(f"{Colors.BOLD}🔧 Configuration:{Colors.ENDC}")
         print(f"  🪙 Token Limit: {Colors.CYAN}{orchestrator.token_limit}{Colors.ENDC}")
         print(f"  📊 Token Source: {Colors.CYAN}{token_source.upper()}{Colors.ENDC}")
@@ -1075,56 +1532,66 @@ def main():
     else:
         print(f"{Colors.GREEN}🚀 Starting complete workflow from the beginning...{Colors.ENDC}\n")
 
-    # Main execution loop
-    run_count = 0
-    while True:
-        run_count += 1
-        
-        if auto_loop and run_count > 1:
-            print(f"\n{Colors.BOLD}{Colors.CYAN}{'=' * 80}{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.CYAN}🔁 AUTO-LOOP RUN #{run_count}{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.CYAN}{'=' * 80}{Colors.ENDC}\n")
-        
-        try:
-            start_time = time.time()
-            orchestrator.run_complete_workflow(resume_from=resume_from if run_count == 1 else 0, token_source=token_source, fetch_traders=fetch_traders)
-            elapsed = time.time() - start_time
+    # Main execution loop; pooled HTTP connections are released however it ends
+    try:
+        run_count = 0
+        while True:
+            run_count += 1
             
-            print(f"\n{Colors.BOLD}{Colors.GREEN}{'=' * 80}{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.GREEN}🎉 WORKFLOW COMPLETED SUCCESSFULLY! 🎉{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.GREEN}{'=' * 80}{Colors.ENDC}")
-            print(f"{Colors.BOLD}Run #{run_count} Time:{Colors.ENDC} {Colors.CYAN}{elapsed:.1f}s ({elapsed/60:.1f} minutes){Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.GREEN}{'=' * 80}{Colors.ENDC}\n")
+            if auto_loop and run_count > 1:
+                print(f"\n{_SEP80_BOLD_CYAN}")
+                print(f"{_H_BOLD_CYAN}🔁 AUTO-LOOP RUN #{run_count}{Colors.ENDC}")
+                print(f"{_SEP80_BOLD_CYAN}\n")
             
-            # If auto-loop is disabled, break after first run
-            if not auto_loop:
+            try:
+                start_time = time.monotonic()
+                orchestrator.run_complete_workflow(resume_from=resume_from if run_count == 1 else 0, token_source=token_source, fetch_traders=fetch_traders)
+                # Monotonic for the duration (immune to clock steps); wall clock only for the ETA
+                elapsed = time.monotonic() - start_time
+                
+                sys.stdout.write(
+                    f"\n{_SEP80_BOLD_GREEN}\n"
+                    f"{_H_BOLD_GREEN}🎉 WORKFLOW COMPLETED SUCCESSFULLY! 🎉{Colors.ENDC}\n"
+                    f"{_SEP80_BOLD_GREEN}\n"
+                    f"{Colors.BOLD}Run #{run_count} Time:{Colors.ENDC} {Colors.CYAN}{elapsed:.1f}s ({elapsed/60:.1f} minutes){Colors.ENDC}\n"
+                    f"{_SEP80_BOLD_GREEN}\n\n"
+                )
+                sys.stdout.flush()
+                
+                # If auto-loop is disabled, break after first run
+                if not auto_loop:
+                    break
+                
+                # Wait for next run
+                hours = loop_interval_minutes / 60
+                next_run = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(time.time() + loop_interval_minutes * 60))
+                print(f"{_H_BOLD_CYAN}🕒 Waiting {loop_interval_minutes} minutes ({hours:.1f} hours) before next run...{Colors.ENDC}")
+                print(f"{Colors.CYAN}Next run will start at: {next_run}{Colors.ENDC}")
+                print(f"{Colors.YELLOW}Press Ctrl+C to stop auto-loop{Colors.ENDC}\n")
+                
+            except KeyboardInterrupt:
+                if auto_loop:
+                    print(f"\n{Colors.YELLOW}⚠️  Auto-loop interrupted by user{Colors.ENDC}")
+                    print(f"{Colors.CYAN}Completed {run_count} run(s) before stopping{Colors.ENDC}\n")
+                else:
+                    print(f"\n{Colors.YELLOW}⚠️  Workflow interrupted by user{Colors.ENDC}")
                 break
+            except Exception as e:
+                logger.error("Workflow failed with error: %s", e, exc_info=True)
+                print(f"\n{Colors.RED}❌ Workflow failed: {e}{Colors.ENDC}")
+                
+                if auto_loop:
+                    print(f"{Colors.YELLOW}⚠️  Error occurred in run #{run_count}{Colors.ENDC}")
+                    print(f"{Colors.CYAN}Auto-loop will continue after waiting period...{Colors.ENDC}\n")
+                else:
+                    break
             
-            # Wait for next run
-            hours = loop_interval_minutes / 60
-            print(f"{Colors.BOLD}{Colors.CYAN}🕒 Waiting {loop_interval_minutes} minutes ({hours:.1f} hours) before next run...{Colors.ENDC}")
-            print(f"{Colors.CYAN}Next run will start at: {datetime.fromtimestamp(time.time() + loop_interval_minutes * 60).strftime('%Y-%m-%d %H:%M:%S')}{Colors.ENDC}")
-            print(f"{Colors.YELLOW}Press Ctrl+C to stop auto-loop{Colors.ENDC}\n")
-            
-            time.sleep(loop_interval_minutes * 60)
-            
-        except KeyboardInterrupt:
-            if auto_loop:
+            if _wait_interruptible(loop_interval_minutes * 60):
                 print(f"\n{Colors.YELLOW}⚠️  Auto-loop interrupted by user{Colors.ENDC}")
                 print(f"{Colors.CYAN}Completed {run_count} run(s) before stopping{Colors.ENDC}\n")
-            else:
-                print(f"\n{Colors.YELLOW}⚠️  Workflow interrupted by user{Colors.ENDC}")
-            break
-        except Exception as e:
-            logger.error(f"Workflow failed with error: {e}", exc_info=True)
-            print(f"\n{Colors.RED}❌ Workflow failed: {e}{Colors.ENDC}")
-            
-            if auto_loop:
-                print(f"{Colors.YELLOW}⚠️  Error occurred in run #{run_count}{Colors.ENDC}")
-                print(f"{Colors.CYAN}Auto-loop will continue after waiting period...{Colors.ENDC}\n")
-                time.sleep(loop_interval_minutes * 60)
-            else:
                 break
+    finally:
+        orchestrator.close()
 
 if __name__ == "__main__":
     main()
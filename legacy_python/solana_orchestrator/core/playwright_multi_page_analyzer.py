@@ -7,49 +7,179 @@ realized PnL. Uses async/await patterns for true parallelism without race condit
 """
 
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import asyncio
 import random
 import time
-import json
+import orjson
 import os
+import atexit
 import re
+import sys
+import queue
+import logging
+import logging.handlers
 from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlsplit
 from dataclasses import dataclass
 import time as time_module
+from aiolimiter import AsyncLimiter
+
+try:
+    import uvloop  # libuv event loop; not available on Windows
+except ImportError:
+    uvloop = None
 
 
 URL_TEMPLATE = "https://dexcheck.ai/app/wallet-analyzer/{wallet_address}"
 SCANNED_WALLETS_FILE = os.path.join("..", "data", "scanned_wallets.txt")
 
+# Resolved once; wallet URLs are built by plain concatenation
+_URL_PREFIX = "https://dexcheck.ai/app/wallet-analyzer/"
+_SCANNED_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), SCANNED_WALLETS_FILE))
+
+# Page tasks only enqueue log records; a listener thread does the blocking stdout writes
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _console_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
+def _drain_log():
+    """Block until every queued log record has been written"""
+    _log_listener.stop()
+    _log_listener.start()
+
+
+# Dump page context for failed extractions (fetches the full HTML, so off by default)
+DEBUG_DEX = bool(os.environ.get("DEBUG_DEX"))
+
+# Stats section that appears once DexCheck has loaded the wallet
+_STATS_XPATH = "//div[h3[contains(text(), 'Win Rate') or contains(text(), 'Gross Profit')]]"
+
+# Stat cells on the DexCheck wallet page; only their text crosses CDP
+_WINRATE_XPATH = "//h3[contains(., 'Win Rate')]/following-sibling::p[contains(@class, 'text-2xl')]"
+_WINRATE_FALLBACK_XPATH = "//h3[contains(., 'Win Rate')]/following-sibling::*[1]"
+_PNL_XPATH = "//p[contains(., 'Realized')]/following-sibling::p[1]//span"
+_PNL_FALLBACK_XPATH = "//p[contains(., 'Realized')]/.."
+_METRIC_XPATHS = [_WINRATE_XPATH, _WINRATE_FALLBACK_XPATH, _PNL_XPATH, _PNL_FALLBACK_XPATH]
+
+# Resolves every XPath in one evaluate() round-trip, returning each match's text (or null)
+_METRICS_JS = """xpaths => xpaths.map(xpath => {
+    const node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    return node ? node.innerText : null;
+})"""
+
+# 'stats' once the stats section renders, 'no-data' when DexCheck reports nothing
+# to show for the address, false (keep polling) otherwise
+_DATA_STATE_JS = """statsXpath => {
+    if (document.evaluate(statsXpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue) {
+        return 'stats';
+    }
+    const text = document.body ? document.body.textContent.toLowerCase() : '';
+    if (text.includes('no data for this wallet') || text.includes('not a wallet address')) {
+        return 'no-data';
+    }
+    return false;
+}"""
+
+# True once the win-rate and PnL cells show numbers instead of loading spinners
+_METRICS_READY_JS = """xpaths => xpaths.every(xpath => {
+    const node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    return node !== null && /\\d/.test(node.textContent);
+})"""
+
+_WR_RE = re.compile(r'\s*([\d.]+)%')
+_PNL_RE = re.compile(r'\(([\d.]+)%\)')
+_PNL_FALLBACK_RE = re.compile(r'\$[\d,.]+[^(]*\(([\d.]+)%\)')
+_DEBUG_WR_RE = re.compile(r'.{0,150}Win Rate.{0,150}', re.IGNORECASE)
+_DEBUG_REALIZED_RE = re.compile(r'.{0,150}Realized.{0,150}', re.IGNORECASE)
 
-def load_scanned_wallets() -> set:
-    """Load previously scanned wallets from file"""
-    scanned_file = os.path.join(os.path.dirname(__file__), SCANNED_WALLETS_FILE)
-    if os.path.exists(scanned_file):
+
+# Requests not needed to read the stats; aborted for every page in the context
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+# Matched against the request host (and its subdomains), never the path or query
+_BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net", "hotjar.com",
+                  "segment.io", "segment.com")
+
+
+def _is_blocked_host(url: str) -> bool:
+    host = urlsplit(url).hostname or ""
+    return any(host == blocked or host.endswith("." + blocked) for blocked in _BLOCKED_HOSTS)
+
+
+async def _block_heavy_requests(route):
+    """Route handler that drops media and analytics requests"""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _is_blocked_host(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class _ScannedStore:
+    """
+    Scanned-wallet set backed by the append-only scanned_wallets.txt.
+    The file is parsed once per process; new entries go through one
+    long-lived buffered handle that is flushed periodically by the
+    analyzer and closed at the end of each run (no fsync).
+    """
+    BUFFER_SIZE = 65536
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._set = set()
+        self._loaded = False
+        self._fh = None
+    
+    def load(self) -> set:
+        """Return the set of scanned wallets, reading the file on first use"""
+        if not self._loaded:
+            try:
+                with open(self.path, 'r') as f:
+                    self._set.update(line.split('|', 1)[0].strip() for line in f if '|' in line)
+            except Exception:
+                pass
+            self._loaded = True
+        return self._set
+    
+    def mark(self, wallet_address: str):
+        """Record a wallet as scanned (no await inside, so safe across page tasks)"""
+        self._set.add(wallet_address)
         try:
-            with open(scanned_file, 'r') as f:
-                wallets = set()
-                for line in f:
-                    line = line.strip()
-                    if line and '|' in line:
-                        wallet = line.split('|')[0]
-                        wallets.add(wallet)
-                return wallets
+            if self._fh is None:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._fh = open(self.path, 'a', buffering=self.BUFFER_SIZE)
+            self._fh.write(f"{wallet_address}|{int(time_module.time())}\n")
         except Exception:
             pass
-    return set()
+    
+    def flush(self):
+        """Push buffered entries to the file"""
+        if self._fh is not None:
+            try:
+                self._fh.flush()
+            except Exception:
+                pass
+    
+    def close(self):
+        """Flush and release the handle; the next mark() reopens the file"""
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except Exception:
+                pass
+            self._fh = None
 
 
-def save_scanned_wallet(wallet_address: str):
-    """Save a wallet address as scanned"""
-    scanned_file = os.path.join(os.path.dirname(__file__), SCANNED_WALLETS_FILE)
-    try:
-        os.makedirs(os.path.dirname(scanned_file), exist_ok=True)
-        with open(scanned_file, 'a') as f:
-            timestamp = int(time_module.time())
-            f.write(f"{wallet_address}|{timestamp}\n")
-    except Exception:
-        pass
+_scanned_store = _ScannedStore(_SCANNED_PATH)
+atexit.register(_scanned_store.close)
 
 
 @dataclass
@@ -63,15 +193,55 @@ class PlaywrightAnalyzerConfig:
     min_realized_pnl: float = 100.0
 
 
+# Colors and static pieces of the per-wallet result box
+_GREEN = '\033[92m'
+_RED = '\033[91m'
+_CYAN = '\033[96m'
+_BOLD = '\033[1m'
+_RESET = '\033[0m'
+_PASS_ICON = f"{_GREEN}✅ PASS{_RESET}"
+_FAIL_ICON = f"{_RED}❌ FAIL{_RESET}"
+_CHECK = f"{_GREEN}✓{_RESET}"
+_CROSS = f"{_RED}✗{_RESET}"
+_WALLET_LABEL = f"{_BOLD}Wallet:{_RESET}"
+_WINRATE_LABEL = f"{_BOLD}Win Rate:{_RESET}"
+_PNL_LABEL = f"{_BOLD}PnL:{_RESET}"
+_BOX_TOP_RULE = "─" * 41
+_BOX_SIDE = f"{_CYAN}│{_RESET}"
+_BOX_BOTTOM = f"{_CYAN}└{'─' * 52}┘{_RESET}"
+
+
 class PageWorker:
     """Manages a single page within the browser for wallet analysis"""
     
+    # Long-lived pages leak renderer memory; replace them after this many wallets or seconds
+    MAX_WALLETS_PER_PAGE = 50
+    MAX_PAGE_AGE = 300
+    
     def __init__(self, page: Page, worker_id: int, config: PlaywrightAnalyzerConfig):
         self.page = page
         self.worker_id = worker_id
         self.config = config
         self.wallets_processed = 0
         self.wallets_passed = 0
+        self.pages_processed = 0
+        self.created_at = time_module.monotonic()
+    
+    async def recycle_if_stale(self):
+        """Count one wallet on the current page and swap in a fresh page once it is too old or too used"""
+        self.pages_processed += 1
+        if (self.pages_processed < self.MAX_WALLETS_PER_PAGE
+                and time_module.monotonic() - self.created_at < self.MAX_PAGE_AGE):
+            return
+        
+        context = self.page.context
+        try:
+            await self.page.close()
+        except Exception:
+            pass
+        self.page = await context.new_page()
+        self.pages_processed = 0
+        self.created_at = time_module.monotonic()
     
     async def analyze_wallet(self, wallet_address: str) -> Optional[Dict]:
         """
@@ -82,36 +252,40 @@ class PageWorker:
         for attempt in range(max_retries):
             try:
                 # Build URL
-                url = URL_TEMPLATE.format(wallet_address=wallet_address)
+                url = _URL_PREFIX + wallet_address
                 
                 # Navigate to DexCheck
                 await self.page.goto(url, wait_until="domcontentloaded", timeout=60000)
                 
                 # Wait up to 30 seconds for data to appear (but continue as soon as it loads)
-                print(f"Page {self.worker_id}: Waiting for data (max 30s) for {wallet_address[:8]}...")
+                logger.info("Page %s: Waiting for data (max 30s) for %s...", self.worker_id, wallet_address[:8])
                 success = await self._wait_for_data_with_timeout(30)
                 
                 if not success:
-                    print(f"Page {self.worker_id}: ⏭️  Skipping {wallet_address[:8]}... (no data after 30s)")
+                    logger.info("Page %s: ⏭️  Skipping %s... (no data)", self.worker_id, wallet_address[:8])
                     return None  # Skip this wallet, don't retry
                 
-                # Give it 10 more seconds for the SVG spinners to finish and actual values to render
-                await asyncio.sleep(10)
+                # Continue as soon as the SVG spinners are replaced by actual values (up to 12s)
+                try:
+                    await self.page.wait_for_function(
+                        _METRICS_READY_JS, arg=[_WINRATE_XPATH, _PNL_XPATH], timeout=12000
+                    )
+                except PlaywrightTimeoutError:
+                    await asyncio.sleep(0.5)
                 
                 # Extract win rate and realized PnL
-                winrate = await self._extract_winrate()
-                realized_pnl = await self._extract_realized_pnl()
+                winrate, realized_pnl = await self._extract_metrics()
                 
                 # Debug on first attempt
-                if attempt == 0 and (winrate is None or realized_pnl is None):
+                if DEBUG_DEX and attempt == 0 and (winrate is None or realized_pnl is None):
                     html = await self.page.content()
                     # Save snippet for debugging
-                    win_match = re.search(r'.{0,150}Win Rate.{0,150}', html, re.IGNORECASE)
+                    win_match = _DEBUG_WR_RE.search(html)
                     if win_match:
-                        print(f"DEBUG Win Rate context: {win_match.group(0)[:200]}")
-                    real_match = re.search(r'.{0,150}Realized.{0,150}', html, re.IGNORECASE)
+                        logger.info("DEBUG Win Rate context: %s", win_match.group(0)[:200])
+                    real_match = _DEBUG_REALIZED_RE.search(html)
                     if real_match:
-                        print(f"DEBUG Realized context: {real_match.group(0)[:200]}")
+                        logger.info("DEBUG Realized context: %s", real_match.group(0)[:200])
                 
                 if winrate is None or realized_pnl is None:
                     # Debug: show which field failed
@@ -120,7 +294,7 @@ class PageWorker:
                         missing.append("winrate")
                     if realized_pnl is None:
                         missing.append("PnL")
-                    print(f"Page {self.worker_id} attempt {attempt+1}: Failed to extract {','.join(missing)} for {wallet_address[:8]}...")
+                    logger.info("Page %s attempt %s: Failed to extract %s for %s...", self.worker_id, attempt + 1, ','.join(missing), wallet_address[:8])
                     if attempt < max_retries - 1:
                         await asyncio.sleep(2)  # Brief pause before retry
                         continue
@@ -148,25 +322,20 @@ class PageWorker:
                     }
                 
             except Exception as e:
-                print(f"Page {self.worker_id} attempt {attempt+1} error: {wallet_address[:8]}... - {str(e)[:50]}")
+                logger.info("Page %s attempt %s error: %s... - %s", self.worker_id, attempt + 1, wallet_address[:8], str(e)[:50])
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2)  # Brief pause before retry
                     continue
                 else:
-                    print(f"Page {self.worker_id} failed after {max_retries} attempts: {wallet_address[:8]}...")
+                    logger.info("Page %s failed after %s attempts: %s...", self.worker_id, max_retries, wallet_address[:8])
                     return None
         
         return None
     
     def _display_wallet_result(self, wallet_address: str, winrate: float, realized_pnl: float):
         """Display wallet analysis result with beautiful formatting"""
-        # Colors
-        GREEN = '\033[92m'
-        RED = '\033[91m'
-        YELLOW = '\033[93m'
-        CYAN = '\033[96m'
-        BOLD = '\033[1m'
-        RESET = '\033[0m'
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
         # Shortened wallet address
         short_wallet = wallet_address[:8] + "..." + wallet_address[-4:]
@@ -176,111 +345,85 @@ class PageWorker:
         pnl_meets = realized_pnl >= self.config.min_realized_pnl
         
         # Overall pass/fail
-        if wr_meets and pnl_meets:
-            status_icon = f"{GREEN}✅ PASS{RESET}"
-            status_color = GREEN
-        else:
-            status_icon = f"{RED}❌ FAIL{RESET}"
-            status_color = RED
+        status_icon = _PASS_ICON if wr_meets and pnl_meets else _FAIL_ICON
         
         # Format winrate with color
         if wr_meets:
-            wr_display = f"{GREEN}{winrate:.1f}%{RESET} {GREEN}✓{RESET}"
+            wr_display = f"{_GREEN}{winrate:.1f}%{_RESET} {_CHECK}"
         else:
-            wr_display = f"{RED}{winrate:.1f}%{RESET} {RED}✗{RESET} (need {self.config.min_winrate:.0f}%)"
+            wr_display = f"{_RED}{winrate:.1f}%{_RESET} {_CROSS} (need {self.config.min_winrate:.0f}%)"
         
         # Format PnL with color
         if pnl_meets:
-            pnl_display = f"{GREEN}{realized_pnl:.1f}%{RESET} {GREEN}✓{RESET}"
+            pnl_display = f"{_GREEN}{realized_pnl:.1f}%{_RESET} {_CHECK}"
         else:
-            pnl_display = f"{RED}{realized_pnl:.1f}%{RESET} {RED}✗{RESET} (need {self.config.min_realized_pnl:.0f}%)"
+            pnl_display = f"{_RED}{realized_pnl:.1f}%{_RESET} {_CROSS} (need {self.config.min_realized_pnl:.0f}%)"
         
-        # Print beautiful result
-        print(f"\n{CYAN}┌─ Page {self.worker_id} ─────────────────────────────────────────┐{RESET}")
-        print(f"{CYAN}│{RESET} {BOLD}Wallet:{RESET} {short_wallet:45} {status_icon} {CYAN}│{RESET}")
-        print(f"{CYAN}│{RESET} {BOLD}Win Rate:{RESET}  {wr_display:60} {CYAN}│{RESET}")
-        print(f"{CYAN}│{RESET} {BOLD}PnL:{RESET}       {pnl_display:60} {CYAN}│{RESET}")
-        print(f"{CYAN}└────────────────────────────────────────────────────┘{RESET}")
+        # Print beautiful result as one record
+        logger.info(
+            f"\n{_CYAN}┌─ Page {self.worker_id} {_BOX_TOP_RULE}┐{_RESET}\n"
+            f"{_BOX_SIDE} {_WALLET_LABEL} {short_wallet:45} {status_icon} {_BOX_SIDE}\n"
+            f"{_BOX_SIDE} {_WINRATE_LABEL}  {wr_display:60} {_BOX_SIDE}\n"
+            f"{_BOX_SIDE} {_PNL_LABEL}       {pnl_display:60} {_BOX_SIDE}\n"
+            f"{_BOX_BOTTOM}"
+        )
     
     async def _wait_for_data_with_timeout(self, timeout_seconds: int) -> bool:
         """
         Wait for DexCheck data to load within the specified timeout.
-        Returns True if data appears, False if timeout.
+        Returns True if data appears; False as soon as a no-data message shows, or on timeout.
         """
         try:
-            # Wait for either stats section or no-data message
-            await asyncio.wait_for(
-                asyncio.gather(
-                    self.page.wait_for_selector(
-                        "xpath=//div[h3[contains(text(), 'Win Rate') or contains(text(), 'Gross Profit')]]",
-                        timeout=timeout_seconds * 1000
-                    )
-                ),
-                timeout=timeout_seconds
+            # One in-page poll for either outcome, so no-data wallets don't wait out the timeout
+            # and nothing needs to re-read the page afterwards
+            state = await self.page.wait_for_function(
+                _DATA_STATE_JS, arg=_STATS_XPATH, timeout=timeout_seconds * 1000, polling=250
             )
-            return True
-        except asyncio.TimeoutError:
-            # Check if it's a "no data" case
-            try:
-                page_text = await self.page.content()
-                if "no data for this wallet" in page_text.lower() or "not a wallet address" in page_text.lower():
-                    return False  # Valid "no data" response, don't retry
-                return False  # Timeout without data, should retry
-            except Exception:
-                return False
+            return await state.json_value() == "stats"
         except Exception:
             return False
     
-    async def _extract_winrate(self) -> Optional[float]:
-        """Extract win rate percentage from the page"""
+    async def _extract_metrics(self) -> Tuple[Optional[float], Optional[float]]:
+        """Extract win rate and realized PnL percentage (return %) in a single page round-trip"""
         try:
-            # Get full page HTML
-            html = await self.page.content()
-            
-            # Pattern: Win Rate</h3><p class="...text-2xl">XX.XX%
-            match = re.search(r'Win Rate</h3><p[^>]*text-2xl[^>]*>([\d\.]+)%', html, re.IGNORECASE)
-            if match:
-                value = float(match.group(1))
-                if 0 <= value <= 100:
-                    return value
-            
-            # Fallback: Simple pattern
-            match = re.search(r'Win Rate[^<]*<[^>]*>([\d\.]+)%', html, re.IGNORECASE)
+            wr_text, wr_fallback_text, pnl_text, pnl_row_text = await self.page.evaluate(_METRICS_JS, _METRIC_XPATHS)
+        except Exception:
+            return None, None
+        return self._parse_winrate(wr_text, wr_fallback_text), self._parse_realized_pnl(pnl_text, pnl_row_text)
+    
+    @staticmethod
+    def _parse_winrate(*texts: Optional[str]) -> Optional[float]:
+        """<h3>Win Rate</h3><p class="...text-2xl">XX.XX%</p>, falling back to the next sibling"""
+        for text in texts:
+            match = _WR_RE.match(text) if text else None
             if match:
-                value = float(match.group(1))
+                try:
+                    value = float(match.group(1))
+                except ValueError:
+                    continue
                 if 0 <= value <= 100:
                     return value
-            
-            return None
-        except Exception as e:
-            return None
+        return None
     
-    async def _extract_realized_pnl(self) -> Optional[float]:
-        """Extract realized PnL percentage (return %) from the page"""
-        try:
-            # Get full page HTML
-            html = await self.page.content()
-            
-            # Pattern: Realized</p><p...>$XXX <span...>(Y.YY%)</span>
-            match = re.search(r'Realized</p><p[^>]*>\$[\d,\.]+\s*<span[^>]*>\(([\d\.]+)%\)</span>', html, re.IGNORECASE)
+    @staticmethod
+    def _parse_realized_pnl(pnl_text: Optional[str], row_text: Optional[str]) -> Optional[float]:
+        """<p>Realized</p><p>$XXX <span>(Y.YY%)</span></p>, falling back to "$XXX (Y.YY%)" in the row"""
+        for text, pattern in ((pnl_text, _PNL_RE), (row_text, _PNL_FALLBACK_RE)):
+            match = pattern.search(text) if text else None
             if match:
-                value = float(match.group(1))
-                return value
-            
-            # Fallback: Simple pattern - $XXX (Y.YY%)
-            match = re.search(r'Realized[^\$]*\$[\d,\.]+[^\(]*\(([\d\.]+)%\)', html, re.IGNORECASE)
-            if match:
-                value = float(match.group(1))
-                return value
-            
-            return None
-        except Exception as e:
-            return None
+                try:
+                    return float(match.group(1))
+                except ValueError:
+                    continue
+        return None
 
 
 class PlaywrightMultiPageAnalyzer:
     """Main coordinator for Playwright multi-page wallet analysis"""
     
+    # Rewrite good_wallets.json after this many new passing wallets (and at the end of a run)
+    SAVE_EVERY = 5
+    
     def __init__(self, config: PlaywrightAnalyzerConfig):
         self.config = config
         self.results = []
@@ -289,6 +432,10 @@ class PlaywrightMultiPageAnalyzer:
         self.scanned_lock = asyncio.Lock()
         self.processed_total = 0
         self.passed_total = 0
+        self._saved_count = 0
+        # Shared across pages: at most one wallet navigation per page per second overall,
+        # but an idle page can start immediately when the others are busy
+        self.rate_limiter = AsyncLimiter(max(1, self.config.num_pages), 1)
         
         # Setup output directory
         os.makedirs(self.config.output_dir, exist_ok=True)
@@ -305,12 +452,18 @@ class PlaywrightMultiPageAnalyzer:
                 "--disable-web-security",
                 "--disable-extensions",
                 "--disable-plugins",
-                "--disable-images",
                 "--no-first-run",
                 "--disable-background-timer-throttling",
                 "--disable-backgrounding-occluded-windows",
                 "--disable-renderer-backgrounding",
-                "--memory-pressure-off"
+                "--memory-pressure-off",
+                # Cap each renderer's V8 heap and drop features that grow long-lived pages
+                "--js-flags=--max-old-space-size=256",
+                "--disable-features=TranslateUI,BackForwardCache,IsolateOrigins,site-per-process,InterestFeedContentSuggestions",
+                "--disable-gpu",
+                "--no-zygote",  # requires --no-sandbox above
+                "--disable-background-networking",
+                "--disable-sync"
             ]
         )
         
@@ -324,132 +477,176 @@ class PlaywrightMultiPageAnalyzer:
         context.set_default_timeout(60000)  # 60 seconds
         context.set_default_navigation_timeout(90000)  # 90 seconds for navigation
         
+        # Skip images, fonts, media and trackers on every page
+        await context.route("**/*", _block_heavy_requests)
+        
         return browser, context
     
     async def _create_pages(self, context: BrowserContext, num_pages: int) -> List[PageWorker]:
-        """Create multiple page objects and wrap them in PageWorkers"""
-        pages = [await context.new_page() for _ in range(num_pages)]
+        """Create multiple page objects in the shared context and wrap them in PageWorkers"""
+        # One context for all pages (contexts are the expensive part); open the pages concurrently
+        pages = await asyncio.gather(*(context.new_page() for _ in range(num_pages)))
         workers = [PageWorker(page, i, self.config) for i, page in enumerate(pages)]
         return workers
     
     def _load_unscanned_wallets(self) -> List[str]:
         """Load previously scanned wallets and filter them out"""
-        scanned = load_scanned_wallets()
+        scanned = _scanned_store.load()
         self.scanned_wallets_set = scanned.copy()
         
-        unscanned = [w for w in self.config.wallets if w not in scanned]
+        # Drop blanks and repeats (first occurrence wins) before filtering.
+        # Addresses are base58, so they are case-sensitive and not lowercased.
+        wallets = list(dict.fromkeys(w for w in map(str.strip, self.config.wallets) if w))
+        unscanned = [w for w in wallets if w not in scanned]
         
-        filtered_count = len(self.config.wallets) - len(unscanned)
+        filtered_count = len(wallets) - len(unscanned)
         if filtered_count > 0:
-            print(f"ℹ️  Filtered out {filtered_count} already-scanned wallets")
+            logger.info("ℹ️  Filtered out %s already-scanned wallets", filtered_count)
         
         if not unscanned:
-            print("⚠️  All wallets have already been scanned")
+            logger.info("⚠️  All wallets have already been scanned")
         
         return unscanned
     
-    def _distribute_wallets(self, wallets: List[str], num_pages: int) -> List[List[str]]:
-        """Split wallet list into N non-overlapping chunks"""
-        if not wallets:
-            return []
+    async def _analyze_and_record(self, worker: PageWorker, wallet_address: str, processed_count: int,
+                                  progress_callback=None) -> bool:
+        """Analyze one wallet on a page, record it as scanned and report progress. Returns True if it passed."""
+        worker_id = worker.worker_id
+        result = await worker.analyze_wallet(wallet_address)
+        await worker.recycle_if_stale()
+        
+        # Mark as scanned
+        _scanned_store.mark(wallet_address)
+        async with self.scanned_lock:
+            self.scanned_wallets_set.add(wallet_address)
         
-        # Adjust if we have fewer wallets than pages
-        actual_pages = min(num_pages, len(wallets))
-        if actual_pages < num_pages:
-            print(f"ℹ️  Only {len(wallets)} wallets available, using {actual_pages} pages instead of {num_pages}")
+        passed = bool(result and result.get("status") == "passed")
         
-        # Distribute wallets across pages
-        chunks = [[] for _ in range(actual_pages)]
-        for idx, wallet in enumerate(wallets):
-            chunks[idx % actual_pages].append(wallet)
+        if passed:
+            # Good wallet that passed criteria
+            async with self.results_lock:
+                self.results.append(result)
+                # Checkpoint periodically so we don't lose results if stopped
+                if len(self.results) - self._saved_count >= self.SAVE_EVERY:
+                    await self._save_results()
         
-        # Log distribution
-        for idx, chunk in enumerate(chunks):
-            print(f"Page {idx}: {len(chunk)} wallets")
+        self._report_progress(progress_callback, worker_id, wallet_address, "passed" if passed else "failed", processed_count + 1)
         
-        return chunks
+        return passed
     
-    async def _page_worker_task(self, worker: PageWorker, wallet_chunk: List[str], progress_callback=None):
-        """Task that processes a chunk of wallets on a single page"""
+    @staticmethod
+    def _report_progress(progress_callback, worker_id: int, wallet_address: str, status: str, progress: int):
+        """Send one wallet's outcome (passed, failed or skipped) to the progress callback, if any"""
+        if progress_callback:
+            try:
+                progress_callback({
+                    "page_id": worker_id,
+                    "wallet": wallet_address,
+                    "status": status,
+                    "progress": progress
+                })
+            except Exception:
+                pass
+    
+    async def _queue_worker_task(self, worker: PageWorker, wallet_queue: asyncio.Queue, progress_callback=None,
+                                 first_wallet: Optional[str] = None):
+        """Task that pulls wallets from a shared queue (after first_wallet, if given) until it sees the None sentinel"""
         worker_id = worker.worker_id
         processed_count = 0
         passed_count = 0
         
-        for wallet_address in wallet_chunk:
-            # Analyze wallet
-            try:
-                result = await worker.analyze_wallet(wallet_address)
+        try:
+            while True:
+                if first_wallet is not None:
+                    wallet_address, first_wallet = first_wallet, None
+                else:
+                    wallet_address = await wallet_queue.get()
+                if wallet_address is None:
+                    # Put the sentinel back so the other pages stop too
+                    wallet_queue.put_nowait(None)
+                    break
                 
-                # Mark as scanned
-                save_scanned_wallet(wallet_address)
                 async with self.scanned_lock:
+                    if wallet_address in self.scanned_wallets_set:
+                        self._report_progress(progress_callback, worker_id, wallet_address, "skipped", processed_count)
+                        continue
                     self.scanned_wallets_set.add(wallet_address)
                 
-                processed_count += 1
-                self.processed_total += 1
-                
-                if result and result.get("status") == "passed":
-                    # Good wallet that passed criteria
-                    passed_count += 1
-                    self.passed_total += 1
-                    async with self.results_lock:
-                        self.results.append(result)
-                        # Save immediately so we don't lose results if stopped
-                        self._save_results()
+                try:
+                    await self.rate_limiter.acquire()
+                    if await self._analyze_and_record(worker, wallet_address, processed_count, progress_callback):
+                        passed_count += 1
+                    processed_count += 1
                     
-                    if progress_callback:
-                        try:
-                            progress_callback({
-                                "page_id": worker_id,
-                                "wallet": wallet_address,
-                                "status": "passed",
-                                "progress": processed_count
-                            })
-                        except Exception:
-                            pass
-                else:
-                    if progress_callback:
-                        try:
-                            progress_callback({
-                                "page_id": worker_id,
-                                "wallet": wallet_address,
-                                "status": "failed",
-                                "progress": processed_count
-                            })
-                        except Exception:
-                            pass
-                
-                # Delay between wallets (optimized for fast VPS)
-                await asyncio.sleep(1.0)
-                
-            except Exception as e:
-                print(f"Page {worker_id} error on wallet {wallet_address}: {e}")
+                except Exception as e:
+                    logger.error("Page %s error on wallet %s: %s", worker_id, wallet_address, e)
+                    self._report_progress(progress_callback, worker_id, wallet_address, "failed", processed_count)
+        finally:
+            # Counts stay local to the page task and are folded into the totals once
+            self.processed_total += processed_count
+            self.passed_total += passed_count
         
-        print(f"Page {worker_id} completed: processed={processed_count}, passed={passed_count}")
+        logger.info("Page %s completed: processed=%s, passed=%s", worker_id, processed_count, passed_count)
+    
+    async def _periodic_flush(self, interval: float = 5.0):
+        """Flush the scanned-wallets buffer every few seconds while pages are running"""
+        while True:
+            await asyncio.sleep(interval)
+            _scanned_store.flush()
     
-    def _save_results(self):
-        """Save good wallets to JSON file"""
+    async def _save_results(self):
+        """Save good wallets to JSON file without blocking the event loop"""
+        results = list(self.results)
+        self._saved_count = len(results)
+        await asyncio.to_thread(self._write_results, results)
+    
+    def _write_results(self, results: List[Dict]):
+        """Serialize and write good_wallets.json (runs in a worker thread)"""
         json_path = os.path.join(self.config.output_dir, "good_wallets.json")
         try:
-            with open(json_path, 'w') as f:
-                json.dump(self.results, f, indent=2)
-            print(f"Saved {len(self.results)} good wallets to {json_path}")
+            with open(json_path, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            logger.info("Saved %s good wallets to %s", len(results), json_path)
         except Exception as e:
-            print(f"Error saving results: {e}")
+            logger.error("Error saving results: %s", e)
     
     async def run(self, progress_callback=None) -> Dict:
         """
-        Main execution method:
-        - Load unscanned wallets
-        - Launch browser and create pages
-        - Distribute wallets across pages
-        - Run all pages concurrently
-        - Aggregate and save results
+        Analyze config.wallets: drop the already-scanned ones, queue the rest
+        and hand the queue to run_stream(), using no more pages than wallets.
+        """
+        unscanned_wallets = self._load_unscanned_wallets()
+        num_pages = min(self.config.num_pages, len(unscanned_wallets))
+        if 0 < num_pages < self.config.num_pages:
+            logger.info("ℹ️  Only %s wallets available, using %s pages instead of %s", len(unscanned_wallets), num_pages, self.config.num_pages)
+        
+        # Shared queue instead of fixed per-page chunks, so a page stuck on
+        # slow wallets doesn't leave the others idle
+        wallet_queue = asyncio.Queue()
+        for wallet_address in unscanned_wallets:
+            wallet_queue.put_nowait(wallet_address)
+        wallet_queue.put_nowait(None)
+        
+        return await self.run_stream(wallet_queue, progress_callback, num_pages=num_pages)
+    
+    async def run_stream(self, wallet_queue: asyncio.Queue, progress_callback=None,
+                         num_pages: Optional[int] = None) -> Dict:
+        """
+        Main execution method: pages pull wallets from wallet_queue as a
+        producer pushes them, and the producer puts None once it is done.
+        Previously scanned wallets are skipped as they arrive, and Chromium
+        is only launched once there is a wallet to analyze.
         """
+        num_pages = num_pages or self.config.num_pages
         try:
-            # Load unscanned wallets
-            unscanned_wallets = self._load_unscanned_wallets()
-            if not unscanned_wallets:
+            self.scanned_wallets_set = _scanned_store.load().copy()
+            
+            # Wait for the first new wallet before paying for a browser launch
+            first_wallet = await wallet_queue.get()
+            while first_wallet is not None and first_wallet in self.scanned_wallets_set:
+                self._report_progress(progress_callback, 0, first_wallet, "skipped", 0)
+                first_wallet = await wallet_queue.get()
+            if first_wallet is None:
                 return {
                     "success": True,
                     "total_scanned": 0,
@@ -458,34 +655,30 @@ class PlaywrightMultiPageAnalyzer:
                     "message": "All wallets already scanned"
                 }
             
-            # Launch Playwright
             async with async_playwright() as playwright:
-                # Build browser and context
-                print("Launching Chromium browser...")
+                logger.info("Launching Chromium browser...")
                 browser, context = await self._build_browser(playwright)
                 
-                # Create page workers
-                print(f"Creating {self.config.num_pages} pages...")
-                workers = await self._create_pages(context, self.config.num_pages)
-                
-                # Distribute wallets
-                wallet_chunks = self._distribute_wallets(unscanned_wallets, len(workers))
-                
-                # Run all pages concurrently
-                print(f"Starting concurrent analysis across {len(workers)} pages...")
-                tasks = [
-                    self._page_worker_task(worker, chunk, progress_callback)
-                    for worker, chunk in zip(workers, wallet_chunks)
-                    if chunk  # Only create task if chunk is not empty
-                ]
+                logger.info("Creating %s pages...", num_pages)
+                workers = await self._create_pages(context, num_pages)
                 
-                await asyncio.gather(*tasks)
+                # Run all pages concurrently; the first page starts with the wallet taken above
+                logger.info("Starting concurrent analysis across %s pages...", len(workers))
+                flusher = asyncio.create_task(self._periodic_flush())
+                try:
+                    await asyncio.gather(*[
+                        self._queue_worker_task(worker, wallet_queue, progress_callback,
+                                                first_wallet=first_wallet if i == 0 else None)
+                        for i, worker in enumerate(workers)
+                    ])
+                finally:
+                    flusher.cancel()
                 
                 # Close browser
                 await browser.close()
             
             # Save results
-            self._save_results()
+            await self._save_results()
             
             # Return summary
             return {
@@ -496,7 +689,8 @@ class PlaywrightMultiPageAnalyzer:
             }
             
         except Exception as e:
-            print(f"Fatal error in Playwright analyzer: {e}")
+            logger.error("Fatal error in Playwright analyzer: %s", e)
+            await self._save_results()
             return {
                 "success": False,
                 "error": str(e),
@@ -504,6 +698,16 @@ class PlaywrightMultiPageAnalyzer:
                 "total_passed": self.passed_total,
                 "good_wallets": self.results
             }
+        finally:
+            _scanned_store.close()
+            _drain_log()
+
+
+def run_async(coro):
+    """asyncio.run() on uvloop when it is installed, the default loop otherwise"""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
 
 
 def create_playwright_analyzer(num_pages: int, wallets: List[str], preset: str, **kwargs) -> PlaywrightMultiPageAnalyzer:
@@ -15,58 +15,168 @@ Date: 2025-10-02
 """
 
 import asyncio
-import json
 import os
 import re
 import random
 import time
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
+from urllib.parse import urlsplit
 from datetime import datetime
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 from dataclasses import dataclass
+from aiolimiter import AsyncLimiter
+import orjson
+import httpx
 import argparse
 
 # Simple wallet tracking (inline)
 TRACKING_AVAILABLE = True
 SCANNED_WALLETS_FILE = os.path.join("..", "data", "scanned_wallets.txt")
 
-def load_scanned_wallets() -> set:
-    """Load previously scanned wallets from file"""
+def load_scanned_wallets(candidates: Set[str]) -> Set[str]:
+    """
+    Return the candidates already recorded in the scanned file. One streaming
+    pass, so memory stays bounded by the input list rather than the history.
+    """
+    scanned: Set[str] = set()
     scanned_file = os.path.join(os.path.dirname(__file__), SCANNED_WALLETS_FILE)
-    if os.path.exists(scanned_file):
-        try:
-            with open(scanned_file, 'r') as f:
-                wallets = set()
-                for line in f:
-                    line = line.strip()
-                    if line and '|' in line:
-                        wallet = line.split('|')[0]
-                        wallets.add(wallet)
-                return wallets
-        except Exception:
-            pass
-    return set()
+    if not candidates or not os.path.exists(scanned_file):
+        return scanned
+    try:
+        with open(scanned_file, 'r') as f:
+            for line in f:
+                wallet = line.split('|', 1)[0]
+                if wallet in candidates:
+                    scanned.add(wallet)
+    except OSError:
+        pass
+    return scanned
 
-def save_scanned_wallet(wallet_address: str):
-    """Save a wallet address as scanned"""
+def migrate_legacy_results() -> int:
+    """Copy a pre-JSONL good_wallets.json array into OUTPUT_FILE once, so earlier passes stay skipped"""
+    if os.path.exists(OUTPUT_FILE) or not os.path.exists(LEGACY_OUTPUT_FILE):
+        return 0
+    try:
+        with open(LEGACY_OUTPUT_FILE, 'rb') as f:
+            results = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return 0
+    if not isinstance(results, list) or not results:
+        return 0
+    with open(OUTPUT_FILE, 'wb') as f:
+        f.write(b'\n'.join(orjson.dumps(result) for result in results) + b'\n')
+    return len(results)
+
+def export_json(json_file: Optional[str] = None) -> int:
+    """Convert the JSONL results into a single JSON array for consumers that need it"""
+    json_file = json_file or LEGACY_OUTPUT_FILE
+    if not os.path.exists(OUTPUT_FILE):
+        return 0
+    with open(OUTPUT_FILE, 'rb') as f:
+        results = [orjson.loads(line) for line in f if line.strip()]
+    with open(json_file, 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    return len(results)
+
+def save_scanned_wallets(lines: str):
+    """Append pre-formatted 'wallet|timestamp' lines to the scanned file in one write"""
+    if not lines:
+        return
     scanned_file = os.path.join(os.path.dirname(__file__), SCANNED_WALLETS_FILE)
     try:
         os.makedirs(os.path.dirname(scanned_file), exist_ok=True)
         with open(scanned_file, 'a') as f:
-            timestamp = int(time.time())
-            f.write(f"{wallet_address}|{timestamp}\n")
+            f.write(lines)
     except Exception:
         pass
 
 # Configuration
 URL_TEMPLATE = "https://dexcheck.ai/app/wallet-analyzer/{wallet_address}"
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36"
+
+# JSON endpoint the wallet page loads its stats from, e.g. "https://.../{wallet_address}"
+# (find it with --discover-api). When set, wallets are fetched over plain HTTP and
+# the browser is only used for wallets the API doesn't answer.
+STATS_API_TEMPLATE = os.environ.get("DEXCHECK_STATS_API", "")
 INPUT_FILE = "owner_addresses.txt"
-OUTPUT_FILE = "good_wallets.json"
+OUTPUT_FILE = "good_wallets.jsonl"  # append-only, one result object per line
+LEGACY_OUTPUT_FILE = "good_wallets.json"  # single JSON array, written before OUTPUT_FILE existed
+TXT_FILE = "good_wallets.txt"
+# Cookies/localStorage kept between runs so Cloudflare and DexCheck's warm-up are paid once
+STORAGE_STATE_FILE = "dexcheck_state.json"
+
+# Subresources the stats DOM doesn't need; aborted for every page in the pool.
+# Stylesheets are safe to drop because extraction reads text_content, not layout.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+# Matched against the request host (and its subdomains), never the path or query
+ANALYTICS_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net", "segment.io", "segment.com",
+                   "sentry.io", "hotjar.com")
 
 # Filter criteria (can be overridden by environment variables)
 MIN_WINRATE = float(os.environ.get("MIN_WINRATE", "70.0"))
 MIN_REALIZED_PNL = float(os.environ.get("MIN_REALIZED_PNL_USD", "100.0"))
 
+# Extraction patterns, compiled once instead of per wallet
+_WINRATE_RE = re.compile(r'([\d\.,]+)')
+_PNL_PAREN_RE = re.compile(r'\(([\d\.,]+)%\)')
+_PNL_BARE_RE = re.compile(r'([\d\.,]+)%')
+
+def _stats_js(winrate_xpath: str, pnl_xpath: str) -> str:
+    """JS that reads the win rate and realized PnL card texts in one browser round-trip"""
+    return f"""() => {{
+    const text = (xpath) => document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue?.textContent?.slice(0, 200) ?? null;
+    return {{wr: text("{winrate_xpath}"), pnl: text("{pnl_xpath}")}};
+}}"""
+
+_STATS_JS = _stats_js(
+    "//div[h3[contains(text(), 'Win Rate')]]//p[contains(@class, 'font-cousine') and contains(@class, 'text-2xl') and contains(text(), '%')]",
+    "//div[h3[contains(text(), 'Gross Profit')]]//div[p[contains(text(), 'Realized')]]//p[contains(@class, 'font-cousine') and contains(@class, 'text-sm')]",
+)
+# Same cards without the styling classes, for when DexCheck changes its CSS
+_STATS_RELAXED_JS = _stats_js(
+    "//div[h3[contains(., 'Win Rate')]]//p[contains(., '%')]",
+    "//div[h3[contains(., 'Gross Profit')]]//div[p[contains(., 'Realized')]]//p[contains(., '%')]",
+)
+_STATS_READY_JS = f"() => {{ const s = ({_STATS_JS})(); return s.wr && s.pnl ? s : null; }}"
+
+def _normalize_key(key: str) -> str:
+    return key.replace('_', '').replace('-', '').lower()
+
+def _find_stat(data, matches) -> Optional[float]:
+    """Depth-first search of a decoded JSON payload for the first numeric value whose key matches"""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if matches(_normalize_key(key)) and not isinstance(value, (dict, list)):
+                try:
+                    return float(str(value).rstrip('%').replace(',', ''))
+                except ValueError:
+                    pass
+        children = data.values()
+    elif isinstance(data, list):
+        children = data
+    else:
+        return None
+    for child in children:
+        found = _find_stat(child, matches)
+        if found is not None:
+            return found
+    return None
+
+_WINRATE_KEYS = frozenset({"winrate", "winratepercent", "winratepct"})
+# Exact names only: a substring test would also accept "unrealizedPnlPercent"
+_REALIZED_PNL_PCT_KEYS = frozenset({
+    "realizedpnlpercent", "realizedpnlpercentage", "realizedpnlpct", "realizedroi", "realizedroipercent",
+})
+
+def _is_winrate_key(key: str) -> bool:
+    return key in _WINRATE_KEYS
+
+def _is_realized_pnl_pct_key(key: str) -> bool:
+    return not key.startswith("unrealized") and key in _REALIZED_PNL_PCT_KEYS
+
+
 # Colors for beautiful terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -80,7 +190,109 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
-@dataclass
+async def block_unneeded_requests(route):
+    """Route handler that aborts images, fonts, media, stylesheets and analytics"""
+    request = route.request
+    host = urlsplit(request.url).hostname or ""
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+            host == blocked or host.endswith("." + blocked) for blocked in ANALYTICS_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """
+    One Chromium browser and context with a queue of pre-opened pages.
+    Open it once and pass it to several scanner runs to skip the browser
+    cold start; pages are reset to about:blank between wallets and
+    replaced after MAX_USES_PER_PAGE wallets.
+    """
+    MAX_USES_PER_PAGE = 50
+    
+    def __init__(self, num_pages: int):
+        self.num_pages = num_pages
+        self.pages: asyncio.Queue = asyncio.Queue()
+        self._uses: Dict[Page, int] = {}
+        self._playwright = None
+        self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
+    
+    async def __aenter__(self) -> "BrowserPool":
+        print(f"{Colors.CYAN}🚀 Launching Chromium browser...{Colors.ENDC}\n")
+        self._playwright = await async_playwright().start()
+        self.browser = await self._playwright.chromium.launch(
+            headless=True,
+            args=[
+                "--disable-blink-features=AutomationControlled",
+                "--no-sandbox",
+                "--disable-dev-shm-usage"
+            ]
+        )
+        
+        self.context = await self.browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent=USER_AGENT,
+            storage_state=STORAGE_STATE_FILE if os.path.exists(STORAGE_STATE_FILE) else None
+        )
+        
+        await self.context.route("**/*", block_unneeded_requests)
+        
+        # Pre-warm the pages
+        for page in await asyncio.gather(*(self.context.new_page() for _ in range(self.num_pages))):
+            self._uses[page] = 0
+            self.pages.put_nowait(page)
+        
+        print(f"{Colors.GREEN}✅ Created {self.num_pages} concurrent pages{Colors.ENDC}\n")
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        try:
+            if self.context is not None:
+                try:
+                    await self.context.storage_state(path=STORAGE_STATE_FILE)
+                except Exception:
+                    pass
+            if self.browser is not None:
+                await self.browser.close()
+        finally:
+            if self._playwright is not None:
+                await self._playwright.stop()
+    
+    async def acquire(self) -> Page:
+        """Take a page from the pool, waiting if all are in use"""
+        return await self.pages.get()
+    
+    async def release(self, page: Page):
+        """Return a page to the pool"""
+        self.pages.put_nowait(page)
+    
+    async def recycle(self, page: Page, force_new: bool = False) -> Page:
+        """
+        Get a page that just analyzed a wallet ready for the next one: reset it to
+        about:blank, or swap it for a fresh page after MAX_USES_PER_PAGE wallets
+        (or when force_new). Pages that never left about:blank are not counted.
+        """
+        if page.url == "about:blank" and not force_new:
+            return page
+        uses = self._uses.pop(page, 0) + 1
+        if not force_new and uses < self.MAX_USES_PER_PAGE:
+            try:
+                await page.goto("about:blank")
+                self._uses[page] = uses
+                return page
+            except Exception:
+                pass
+        try:
+            await page.close()
+        except Exception:
+            pass
+        page = await self.context.new_page()
+        self._uses[page] = 0
+        return page
+
+
+@dataclass(slots=True)
 class PageStatus:
     """Status of a single page worker"""
     page_id: int
@@ -93,23 +305,42 @@ class PageStatus:
 class PlaywrightWalletScanner:
     """Multi-page concurrent wallet scanner using Playwright"""
     
-    def __init__(self, num_pages: int, min_winrate: float, min_pnl: float):
+    # Scanned wallets are appended in batches: every SCANNED_FLUSH_EVERY wallets,
+    # every SCANNED_FLUSH_INTERVAL seconds, and when the run ends
+    SCANNED_FLUSH_EVERY = 50
+    SCANNED_FLUSH_INTERVAL = 5.0
+    BLOCK_BACKOFF = 30.0  # seconds a page waits after a rate limit or challenge
+    
+    # STATUS lines for the orchestrator: at most one per STATUS_INTERVAL seconds,
+    # formatted from a fixed template rather than serializing a dict each time
+    STATUS_INTERVAL = 0.5
+    _STATUS_FMT = 'STATUS: {{"processed":{},"passed":{},"failed":{},"skipped":{}}}'
+    
+    def __init__(self, num_pages: int, min_winrate: float, min_pnl: float,
+                 max_rps: Optional[float] = None):
         self.num_pages = num_pages
         self.min_winrate = min_winrate
         self.min_pnl = min_pnl
         
+        # Caps DexCheck navigations per second across all pages (default: one per page)
+        self._rate_limiter = AsyncLimiter(max_rps or num_pages, 1)
+        
+        # Direct JSON client, only when STATS_API_TEMPLATE is configured (opened in run())
+        self._http: Optional[httpx.AsyncClient] = None
+        
         # State tracking
         self.page_statuses: List[PageStatus] = [PageStatus(i) for i in range(num_pages)]
         self.results: List[Dict] = []
-        self.results_lock = asyncio.Lock()
         self.scanned_wallets: Set[str] = set()
-        self.scanned_lock = asyncio.Lock()
+        self._pending_writes: List[str] = []
         
         # Statistics
         self.total_processed = 0
         self.total_passed = 0
         self.total_skipped = 0
+        self.total_blocked = 0
         self.start_time = None
+        self._last_status = 0.0
         
     def print_header(self):
         """Print beautiful header"""
@@ -124,16 +355,14 @@ class PlaywrightWalletScanner:
         print(f"  💾 Output File: {Colors.CYAN}{OUTPUT_FILE}{Colors.ENDC}")
         print("=" * 80 + "\n")
     
-    def print_status_update(self):
+    def print_status_update(self, force: bool = False):
         """Print machine-readable status update for orchestrator"""
+        now = time.monotonic()
+        if not force and now - self._last_status < self.STATUS_INTERVAL:
+            return
+        self._last_status = now
         failed = self.total_processed - self.total_passed
-        status_data = {
-            'processed': self.total_processed,
-            'passed': self.total_passed,
-            'failed': failed,
-            'skipped': self.total_skipped
-        }
-        print(f"STATUS: {json.dumps(status_data)}")
+        print(self._STATUS_FMT.format(self.total_processed, self.total_passed, failed, self.total_skipped))
     
     async def load_wallets(self) -> List[str]:
         """Load wallet addresses from file"""
@@ -149,94 +378,158 @@ class PlaywrightWalletScanner:
     
     def load_existing_results(self) -> Set[str]:
         """Load already processed wallets from output file"""
+        migrated = migrate_legacy_results()
+        if migrated:
+            print(f"{Colors.CYAN}📦 Migrated {migrated} results from {LEGACY_OUTPUT_FILE} to {OUTPUT_FILE}{Colors.ENDC}")
         if not os.path.exists(OUTPUT_FILE):
             return set()
         
+        wallets = set()
         try:
-            with open(OUTPUT_FILE, 'r') as f:
-                existing = json.load(f)
-                return {w['wallet'] for w in existing}
-        except:
-            return set()
+            with open(OUTPUT_FILE, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    # Skip only the bad line (e.g. one torn by a crash mid-append), not the whole file
+                    try:
+                        wallets.add(orjson.loads(line)['wallet'])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except OSError:
+            pass
+        return wallets
     
-    def distribute_wallets(self, wallets: List[str]) -> List[List[str]]:
-        """Distribute wallets across pages (round-robin)"""
-        chunks = [[] for _ in range(self.num_pages)]
-        for idx, wallet in enumerate(wallets):
-            chunks[idx % self.num_pages].append(wallet)
-        
-        print(f"{Colors.BOLD}📦 WALLET DISTRIBUTION:{Colors.ENDC}")
-        for idx, chunk in enumerate(chunks):
-            print(f"  Page #{idx}: {Colors.CYAN}{len(chunk)} wallets{Colors.ENDC}")
-        print()
-        
-        return chunks
+    @staticmethod
+    def _parse_winrate(text: Optional[str]) -> Optional[float]:
+        """Parse the win rate card text, e.g. "72.5%" -> 72.5"""
+        match = _WINRATE_RE.search(text) if text else None
+        if match:
+            value = float(match.group(1).replace(',', ''))
+            if 0 <= value <= 100:
+                return value
+        return None
     
-    async def extract_winrate(self, page: Page) -> Optional[float]:
-        """Extract win rate using fixed selector"""
-        try:
-            text = await page.locator(
-                "xpath=//div[h3[contains(text(), 'Win Rate')]]//"
-                "p[contains(@class, 'font-cousine') and contains(@class, 'text-2xl') and contains(text(), '%')]"
-            ).first.text_content(timeout=5000)
-            
-            match = re.search(r'([\d\.,]+)', text)
-            if match:
-                value = float(match.group(1).replace(',', ''))
-                if 0 <= value <= 100:
-                    return value
+    @staticmethod
+    def _parse_realized_pnl(text: Optional[str]) -> Optional[float]:
+        """Parse the realized PnL text, e.g. "$1,234 (15.5%)" -> 15.5"""
+        if not text:
             return None
+        # Prefer the percentage in parentheses, else any percentage
+        match = _PNL_PAREN_RE.search(text) or _PNL_BARE_RE.search(text)
+        if match:
+            return float(match.group(1).replace(',', ''))
+        return None
+    
+    async def extract_stats(self, page: Page) -> Tuple[Optional[float], Optional[float]]:
+        """Extract (win rate, realized PnL %) with a single page.evaluate round-trip"""
+        try:
+            data = await page.evaluate(_STATS_JS)
+            if not (data["wr"] and data["pnl"]):
+                # Cards not filled in yet: give them the same 5s the locators used to get
+                handle = await page.wait_for_function(_STATS_READY_JS, timeout=5000)
+                data = await handle.json_value()
         except Exception:
-            # Fallback to regex
+            data = {"wr": None, "pnl": None}
+        
+        winrate = self._parse_winrate(data["wr"])
+        realized_pnl = self._parse_realized_pnl(data["pnl"])
+        
+        if winrate is None or realized_pnl is None:
+            # Fallback: looser selectors, still one evaluate instead of serializing the whole DOM
             try:
-                html = await page.content()
-                match = re.search(r"Win Rate\s*</h3>\s*<p[^>]*>\s*([\d\.,]+)\s*%?", html, re.IGNORECASE)
-                if match:
-                    value = float(match.group(1).replace(',', ''))
-                    if 0 <= value <= 100:
-                        return value
-            except:
+                relaxed = await page.evaluate(_STATS_RELAXED_JS)
+                if winrate is None:
+                    winrate = self._parse_winrate(relaxed["wr"])
+                if realized_pnl is None:
+                    realized_pnl = self._parse_realized_pnl(relaxed["pnl"])
+            except Exception:
                 pass
-            return None
+        return winrate, realized_pnl
+    
+    async def _goto_wallet(self, page: Page, wallet: str):
+        """Navigate page to the wallet's DexCheck page, within the request rate limit"""
+        async with self._rate_limiter:
+            return await page.goto(URL_TEMPLATE.format(wallet_address=wallet), wait_until="domcontentloaded", timeout=60000)
+    
+    def _new_http_client(self) -> httpx.AsyncClient:
+        """HTTP/2 client for the stats API, sized so every page worker can keep requests in flight"""
+        connections = self.num_pages * 4
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=connections, max_keepalive_connections=connections),
+            headers={
+                "User-Agent": USER_AGENT,
+                "Accept": "application/json",
+                "Referer": URL_TEMPLATE.format(wallet_address=""),
+            },
+            timeout=30.0
+        )
     
-    async def extract_realized_pnl(self, page: Page) -> Optional[float]:
-        """Extract realized PnL percentage (return %) using fixed selector"""
+    async def fetch_stats_api(self, wallet: str) -> Optional[Tuple[float, float]]:
+        """Fetch (win rate, realized PnL %) from the JSON API, or None so the browser path takes over"""
         try:
-            # Get the first <p> element which contains both $ and (%)
-            # Text format: "$1,234 (15.5%)" or "$0 (0%)"
-            text = await page.locator(
-                "xpath=//div[h3[contains(text(), 'Gross Profit')]]//"
-                "div[p[contains(text(), 'Realized')]]//"
-                "p[contains(@class, 'font-cousine') and contains(@class, 'text-sm')]"
-            ).first.text_content(timeout=5000)
-            
-            # Extract percentage from parentheses: "$1,234 (15.5%)" -> 15.5
-            match = re.search(r'\(([\d\.,]+)%\)', text)
-            if match:
-                percentage = float(match.group(1).replace(',', ''))
-                return percentage
-            
-            # If no parentheses, try to extract any percentage
-            match = re.search(r'([\d\.,]+)%', text)
-            if match:
-                percentage = float(match.group(1).replace(',', ''))
-                return percentage
-            
+            async with self._rate_limiter:
+                response = await self._http.get(STATS_API_TEMPLATE.format(wallet_address=wallet))
+            if response.status_code != 200:
+                return None
+            data = orjson.loads(response.content)
+        except (httpx.HTTPError, ValueError):
             return None
-        except Exception:
-            # Fallback to regex
-            try:
-                html = await page.content()
-                match = re.search(r'Realized\s*</p>\s*<p[^>]*>\s*\$[\d\.,]+\s*\(([\d\.,]+)%\)', html, re.IGNORECASE)
-                if match:
-                    percentage = float(match.group(1).replace(',', ''))
-                    return percentage
-            except:
-                pass
+        
+        winrate = _find_stat(data, _is_winrate_key)
+        realized_pnl = _find_stat(data, _is_realized_pnl_pct_key)
+        if winrate is None or realized_pnl is None:
+            return None
+        if 0 < winrate <= 1:
+            winrate *= 100  # sent as a fraction (0.8) rather than a percentage
+        if not 0 <= winrate <= 100:
             return None
+        return winrate, realized_pnl
+    
+    def _check_criteria(self, wallet: str, page_id: int, winrate: float, realized_pnl: float) -> Optional[Dict]:
+        """Build the result record if the wallet passes the filters"""
+        if winrate >= self.min_winrate and realized_pnl >= self.min_pnl:
+            print(f"Page {page_id} ✅ Found good wallet {wallet[:8]}... (WR: {winrate}%, PnL: {realized_pnl}%)")
+            return {
+                "wallet": wallet,
+                "winrate": f"{winrate}%",
+                "realizedPnL": f"{realized_pnl}%",
+                "timestamp": datetime.now().isoformat()
+            }
+        # Wallet doesn't meet criteria - no retry needed
+        return None
     
-    async def analyze_wallet(self, page: Page, wallet: str, page_id: int) -> Optional[Dict]:
-        """Analyze a single wallet with retry mechanism"""
+    @staticmethod
+    def _retry_delay(attempt: int) -> float:
+        """Jittered, growing pause before a retry so pages don't retry in lockstep"""
+        return random.uniform(0.5, 2 ** attempt)
+    
+    @staticmethod
+    async def _is_blocked(page: Page, response) -> bool:
+        """True for a 429 or a Cloudflare challenge page; only checked on 403/429/503 responses"""
+        if response is None or response.status not in (403, 429, 503):
+            return False
+        if response.status == 429:
+            return True
+        try:
+            return "Just a moment" in await page.title()
+        except Exception:
+            return False
+    
+    async def analyze_wallet(self, page: Page, wallet: str, page_id: int,
+                             preloaded: Optional[asyncio.Task] = None) -> Optional[Dict]:
+        """
+        Analyze a single wallet with retry mechanism. Tries the JSON API first when
+        configured. preloaded is an already started page.goto() for this wallet,
+        used instead of navigating on the first attempt.
+        """
+        if self._http is not None:
+            self.page_statuses[page_id].current_wallet = wallet
+            self.page_statuses[page_id].status = "Fetching"
+            stats = await self.fetch_stats_api(wallet)
+            if stats is not None:
+                return self._check_criteria(wallet, page_id, *stats)
+        
         max_retries = 3
         
         for attempt in range(max_retries):
@@ -246,8 +539,16 @@ class PlaywrightWalletScanner:
                 self.page_statuses[page_id].status = "Loading"
                 
                 # Navigate
-                url = URL_TEMPLATE.format(wallet_address=wallet)
-                await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+                if attempt == 0 and preloaded is not None:
+                    response = await preloaded
+                else:
+                    response = await self._goto_wallet(page, wallet)
+                
+                # Retrying into a rate limit or challenge only burns attempts; move on
+                if await self._is_blocked(page, response):
+                    print(f"Page {page_id}: rate limited or Cloudflare challenge for {wallet[:8]}..., skipping")
+                    self.page_statuses[page_id].status = "Blocked"
+                    return None
                 
                 # Quick 8-second timeout check for VPS
                 success = await self._wait_for_data_with_timeout(page, 8)
@@ -255,7 +556,7 @@ class PlaywrightWalletScanner:
                 if not success:
                     print(f"Page {page_id} attempt {attempt+1}: No data within 8 seconds for {wallet[:8]}...")
                     if attempt < max_retries - 1:
-                        await asyncio.sleep(2)  # Brief pause before retry
+                        await asyncio.sleep(self._retry_delay(attempt))
                         continue
                     else:
                         self.page_statuses[page_id].status = "Failed"
@@ -265,34 +566,23 @@ class PlaywrightWalletScanner:
                 self.page_statuses[page_id].status = "Analyzing"
                 
                 # Extract stats
-                winrate = await self.extract_winrate(page)
-                realized_pnl = await self.extract_realized_pnl(page)
+                winrate, realized_pnl = await self.extract_stats(page)
                 
                 if winrate is None or realized_pnl is None:
                     print(f"Page {page_id} attempt {attempt+1}: Failed to extract data for {wallet[:8]}...")
                     if attempt < max_retries - 1:
-                        await asyncio.sleep(2)  # Brief pause before retry
+                        await asyncio.sleep(self._retry_delay(attempt))
                         continue
                     else:
                         return None
                 
                 # Success! Check criteria
-                if winrate >= self.min_winrate and realized_pnl >= self.min_pnl:
-                    print(f"Page {page_id} ✅ Found good wallet {wallet[:8]}... (WR: {winrate}%, PnL: {realized_pnl}%)")
-                    return {
-                        "wallet": wallet,
-                        "winrate": f"{winrate}%",
-                        "realizedPnL": f"{realized_pnl}%",
-                        "timestamp": datetime.now().isoformat()
-                    }
-                else:
-                    # Wallet doesn't meet criteria - no retry needed
-                    return None
+                return self._check_criteria(wallet, page_id, winrate, realized_pnl)
                 
             except Exception as e:
                 print(f"Page {page_id} attempt {attempt+1} error: {wallet[:8]}... - {str(e)[:50]}")
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2)  # Brief pause before retry
+                    await asyncio.sleep(self._retry_delay(attempt))
                     continue
                 else:
                     return None
@@ -311,57 +601,118 @@ class PlaywrightWalletScanner:
                 timeout=timeout_seconds
             )
             return True
-        except asyncio.TimeoutError:
-            # Check if it's a "no data" case
-            try:
-                page_text = await page.content()
-                if "no data for this wallet" in page_text.lower() or "not a wallet address" in page_text.lower():
-                    return False  # Valid "no data" response, don't retry
-                return False  # Timeout without data, should retry
-            except Exception:
-                return False
         except Exception:
+            # Timeout or "no data" page: either way the caller decides whether to retry
             return False
     
-    async def page_worker(self, page: Page, wallet_chunk: List[str], page_id: int):
-        """Worker function for a single page"""
-        for wallet in wallet_chunk:
-            # Check if already scanned
-            async with self.scanned_lock:
-                if wallet in self.scanned_wallets:
-                    self.total_skipped += 1
-                    continue
-                self.scanned_wallets.add(wallet)
-            
-            # Mark as scanned in tracker
-            if TRACKING_AVAILABLE:
-                save_scanned_wallet(wallet)
-            
-            # Analyze wallet
-            result = await self.analyze_wallet(page, wallet, page_id)
-            
-            # Update statistics
-            self.page_statuses[page_id].wallets_processed += 1
-            self.total_processed += 1
-            
-            if result:
-                self.page_statuses[page_id].wallets_passed += 1
-                self.total_passed += 1
-                async with self.results_lock:
-                    self.results.append(result)
-            
-            # Update display
-            self.print_status_update()
-            
-            # Small delay between wallets (optimized for fast VPS)
-            await asyncio.sleep(1.0)
+    async def page_worker(self, pool: BrowserPool, wallet_queue: asyncio.Queue, page_id: int,
+                          pages_per_worker: int = 2):
+        """Worker function for the pages it borrows from the pool"""
+        pages = [await pool.acquire() for _ in range(pages_per_worker)]
+        try:
+            await self._scan_queue(pool, pages, wallet_queue, page_id)
+        finally:
+            for page in pages:
+                await pool.release(page)
         
         # Mark page as complete and clear current wallet
         self.page_statuses[page_id].status = "Complete"
         self.page_statuses[page_id].current_wallet = None
     
-    async def run(self):
-        """Main execution method"""
+    def _next_wallet(self, wallet_queue: asyncio.Queue) -> Optional[str]:
+        """
+        Claim the next not-yet-scanned wallet from the queue, or None when it is empty.
+        No lock needed: there is no await between the membership check and the add.
+        """
+        while True:
+            try:
+                wallet = wallet_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return None
+            
+            # Check if already scanned
+            if wallet in self.scanned_wallets:
+                self.total_skipped += 1
+                continue
+            self.scanned_wallets.add(wallet)
+            return wallet
+    
+    async def _scan_queue(self, pool: BrowserPool, pages: List[Page], wallet_queue: asyncio.Queue,
+                          page_id: int):
+        """
+        Scan wallets from the shared queue until it is empty. With two pages,
+        the next wallet starts loading on the spare page while the current
+        one is being analyzed, then the pages swap roles. A blocked page is
+        swapped for a fresh one and the worker backs off before continuing.
+        """
+        wallet = self._next_wallet(wallet_queue)
+        nav_task = next_nav = None
+        try:
+            while wallet is not None:
+                next_wallet = self._next_wallet(wallet_queue)
+                next_nav = None
+                # With the JSON API the browser is only a fallback, so don't prefetch
+                if next_wallet is not None and len(pages) > 1 and self._http is None:
+                    next_nav = asyncio.create_task(self._goto_wallet(pages[1], next_wallet))
+                
+                # Analyze wallet
+                result = await self.analyze_wallet(pages[0], wallet, page_id, preloaded=nav_task)
+                
+                # Blocked wallets were never really scanned: leave them for the next run
+                if self.page_statuses[page_id].status == "Blocked":
+                    self.total_blocked += 1
+                    pages[0] = await pool.recycle(pages[0], force_new=True)
+                    await asyncio.sleep(random.uniform(0.5, 1.0) * self.BLOCK_BACKOFF)
+                    pages.reverse()
+                    wallet, nav_task = next_wallet, next_nav
+                    continue
+                
+                # Mark as scanned in tracker
+                if TRACKING_AVAILABLE:
+                    self._pending_writes.append(f"{wallet}|{int(time.time())}\n")
+                    if len(self._pending_writes) >= self.SCANNED_FLUSH_EVERY:
+                        await self.flush_scanned()
+                
+                # Update statistics
+                self.page_statuses[page_id].wallets_processed += 1
+                self.total_processed += 1
+                
+                if result:
+                    self.page_statuses[page_id].wallets_passed += 1
+                    self.total_passed += 1
+                    self.results.append(result)
+                
+                # Update display
+                self.print_status_update()
+                
+                pages[0] = await pool.recycle(pages[0])
+                pages.reverse()
+                wallet, nav_task = next_wallet, next_nav
+        finally:
+            for task in (nav_task, next_nav):
+                if task is not None and not task.done():
+                    task.cancel()
+    
+    def _take_pending_writes(self) -> str:
+        """Detach the buffered scanned-wallet lines as one string"""
+        lines = "".join(self._pending_writes)
+        self._pending_writes.clear()
+        return lines
+    
+    async def flush_scanned(self):
+        """Append buffered scanned wallets without blocking the event loop"""
+        lines = self._take_pending_writes()
+        if lines:
+            await asyncio.to_thread(save_scanned_wallets, lines)
+    
+    async def _flusher(self):
+        """Periodically flush scanned wallets while pages are running"""
+        while True:
+            await asyncio.sleep(self.SCANNED_FLUSH_INTERVAL)
+            await self.flush_scanned()
+    
+    async def run(self, pool: Optional[BrowserPool] = None):
+        """Main execution method. Reuses pool when given, otherwise opens a browser for this run."""
         self.start_time = time.time()
         
         # Print header
@@ -378,11 +729,12 @@ class PlaywrightWalletScanner:
         
         # Load scanned wallets from tracker
         if TRACKING_AVAILABLE:
-            tracked = load_scanned_wallets()
-            self.scanned_wallets = existing.union(tracked)
-            print(f"{Colors.YELLOW}ℹ️  Loaded {len(tracked)} tracked wallets{Colors.ENDC}\n")
+            tracked = load_scanned_wallets(set(all_wallets))
+            print(f"{Colors.YELLOW}ℹ️  Found {len(tracked)} input wallets in the scan history{Colors.ENDC}\n")
+            tracked.update(existing)
+            self.scanned_wallets = tracked
         else:
-            self.scanned_wallets = existing
+            self.scanned_wallets = set(existing)
         
         # Filter out already scanned
         unscanned = [w for w in all_wallets if w not in self.scanned_wallets]
@@ -392,52 +744,35 @@ class PlaywrightWalletScanner:
             print(f"{Colors.YELLOW}⚠️  No new wallets to scan!{Colors.ENDC}")
             return
         
-        # Distribute wallets
-        wallet_chunks = self.distribute_wallets(unscanned)
+        # One shared queue: whichever page is free takes the next wallet
+        wallet_queue: asyncio.Queue = asyncio.Queue()
+        for wallet in unscanned:
+            wallet_queue.put_nowait(wallet)
+        num_workers = min(self.num_pages, len(unscanned))
+        pages_per_worker = 2  # current wallet + prefetch of the next one
+        if STATS_API_TEMPLATE:
+            self._http = self._new_http_client()
+            pages_per_worker = 1  # the browser is only the fallback
+            print(f"{Colors.CYAN}🔌 Using stats API: {STATS_API_TEMPLATE}{Colors.ENDC}\n")
+        print(f"{Colors.BOLD}📦 Queued {len(unscanned)} wallets for {num_workers} pages{Colors.ENDC}\n")
         
-        # Launch Playwright
-        async with async_playwright() as playwright:
-            print(f"{Colors.CYAN}🚀 Launching Chromium browser...{Colors.ENDC}\n")
-            
-            browser = await playwright.chromium.launch(
-                headless=True,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage"
-                ]
-            )
-            
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36"
-            )
-            
-            # Create pages
-            pages = [await context.new_page() for _ in range(self.num_pages)]
-            
-            print(f"{Colors.GREEN}✅ Created {self.num_pages} concurrent pages{Colors.ENDC}\n")
-            print(f"{Colors.BOLD}{Colors.CYAN}🔥 STARTING CONCURRENT ANALYSIS 🔥{Colors.ENDC}\n")
-            
-            await asyncio.sleep(2)  # Brief pause before starting
-            
-            # Initial display
-            print(f"{Colors.BOLD}🔥 Starting concurrent wallet analysis...{Colors.ENDC}\n")
-            
-            # Run all page workers concurrently
-            tasks = [
-                self.page_worker(page, chunk, i)
-                for i, (page, chunk) in enumerate(zip(pages, wallet_chunks))
-                if chunk  # Only create task if chunk has wallets
-            ]
-            
-            await asyncio.gather(*tasks)
-            
-            # Final status update to clear "Analyzing" display
-            self.print_status_update()
-            
-            # Close browser
-            await browser.close()
+        flusher = asyncio.create_task(self._flusher())
+        try:
+            if pool is None:
+                async with BrowserPool(self.num_pages * pages_per_worker) as pool:
+                    await self._run_pages(pool, wallet_queue, num_workers, pages_per_worker)
+            else:
+                # A smaller shared pool gets fewer workers, or no prefetch page, rather than deadlocking
+                pages_per_worker = min(pages_per_worker, pool.num_pages)
+                num_workers = max(1, min(num_workers, pool.num_pages // pages_per_worker))
+                await self._run_pages(pool, wallet_queue, num_workers, pages_per_worker)
+        finally:
+            flusher.cancel()
+            # Synchronous so it also completes while the run is being cancelled
+            save_scanned_wallets(self._take_pending_writes())
+            if self._http is not None:
+                await self._http.aclose()
+                self._http = None
         
         # Save results
         await self.save_results()
@@ -445,33 +780,48 @@ class PlaywrightWalletScanner:
         # Print final summary
         self.print_final_summary()
     
+    async def _run_pages(self, pool: BrowserPool, wallet_queue: asyncio.Queue, num_workers: int,
+                         pages_per_worker: int = 2):
+        """Run num_workers page workers draining wallet_queue on pages from the pool"""
+        print(f"{Colors.BOLD}{Colors.CYAN}🔥 STARTING CONCURRENT ANALYSIS 🔥{Colors.ENDC}\n")
+        
+        await asyncio.sleep(2)  # Brief pause before starting
+        
+        # Initial display
+        print(f"{Colors.BOLD}🔥 Starting concurrent wallet analysis...{Colors.ENDC}\n")
+        
+        # Run all page workers concurrently; if one fails the rest are cancelled
+        # and every worker's finally returns its pages to the pool
+        async with asyncio.TaskGroup() as tg:
+            for i in range(num_workers):
+                tg.create_task(self.page_worker(pool, wallet_queue, i, pages_per_worker))
+        
+        # Final status update to clear "Analyzing" display
+        self.print_status_update(force=True)
+    
     async def save_results(self):
         """Save results to file"""
         if not self.results:
             return
         
-        # Load existing results
-        existing = []
-        if os.path.exists(OUTPUT_FILE):
-            try:
-                with open(OUTPUT_FILE, 'r') as f:
-                    existing = json.load(f)
-            except:
-                pass
-        
-        # Merge and save
-        all_results = existing + self.results
+        # Append only this run's results; earlier runs are already on disk
+        with open(OUTPUT_FILE, 'ab+') as f:
+            # Start on a fresh line if an earlier run died mid-write
+            prefix = b''
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    prefix = b'\n'
+            f.write(prefix + b'\n'.join(orjson.dumps(result) for result in self.results) + b'\n')
         
-        with open(OUTPUT_FILE, 'w') as f:
-            json.dump(all_results, f, indent=2)
-        
-        # Also save to TXT
-        txt_file = OUTPUT_FILE.replace('.json', '.txt')
-        with open(txt_file, 'w') as f:
-            f.write("=" * 60 + "\n")
-            f.write("GOOD WALLETS - ANALYSIS RESULTS\n")
-            f.write("=" * 60 + "\n\n")
-            for wallet in all_results:
+        # Also append to TXT
+        new_txt = not os.path.exists(TXT_FILE)
+        with open(TXT_FILE, 'a') as f:
+            if new_txt:
+                f.write("=" * 60 + "\n")
+                f.write("GOOD WALLETS - ANALYSIS RESULTS\n")
+                f.write("=" * 60 + "\n\n")
+            for wallet in self.results:
                 f.write(f"Wallet: {wallet['wallet']}\n")
                 f.write(f"Win Rate: {wallet['winrate']}\n")
                 f.write(f"Realized PnL: {wallet['realizedPnL']}\n")
@@ -493,14 +843,39 @@ class PlaywrightWalletScanner:
         print(f"  ✅ Wallets Passed: {Colors.GREEN}{self.total_passed}{Colors.ENDC}")
         print(f"  ❌ Wallets Failed: {Colors.RED}{failed}{Colors.ENDC}")
         print(f"  ⏭️  Wallets Skipped: {Colors.YELLOW}{self.total_skipped}{Colors.ENDC}")
+        print(f"  🚫 Wallets Blocked: {Colors.YELLOW}{self.total_blocked}{Colors.ENDC}")
         print(f"  💎 Success Rate: {Colors.CYAN}{(self.total_passed / self.total_processed * 100) if self.total_processed > 0 else 0:.1f}%{Colors.ENDC}")
         print(f"  📈 Avg Time/Wallet: {Colors.CYAN}{elapsed/self.total_processed:.1f}s{Colors.ENDC}" if self.total_processed > 0 else "")
         print(f"\n{Colors.BOLD}Output Files:{Colors.ENDC}")
-        print(f"  💾 JSON: {Colors.CYAN}{OUTPUT_FILE}{Colors.ENDC}")
-        print(f"  📄 TXT: {Colors.CYAN}{OUTPUT_FILE.replace('.json', '.txt')}{Colors.ENDC}")
+        print(f"  💾 JSONL: {Colors.CYAN}{OUTPUT_FILE}{Colors.ENDC}")
+        print(f"  📄 TXT: {Colors.CYAN}{TXT_FILE}{Colors.ENDC}")
         print("=" * 80 + "\n")
 
 
+async def discover_api(pool: BrowserPool, wallet: str, wait_seconds: float = 10.0):
+    """Open one wallet page and print the JSON requests it makes, to find a STATS_API_TEMPLATE"""
+    page = await pool.acquire()
+    seen: List[str] = []
+    
+    def log_response(response):
+        if response.request.resource_type in ("xhr", "fetch") and "json" in response.headers.get("content-type", ""):
+            seen.append(f"{response.status} {response.request.method} {response.url}")
+    
+    page.on("response", log_response)
+    try:
+        await page.goto(URL_TEMPLATE.format(wallet_address=wallet), wait_until="domcontentloaded", timeout=60000)
+        await asyncio.sleep(wait_seconds)
+    finally:
+        page.remove_listener("response", log_response)
+        await pool.release(page)
+    
+    print(f"{Colors.BOLD}🔎 JSON requests made by the page for {wallet[:8]}...:{Colors.ENDC}")
+    for line in seen:
+        print(f"  {line.replace(wallet, '{wallet_address}')}")
+    if not seen:
+        print(f"  {Colors.YELLOW}(none){Colors.ENDC}")
+
+
 async def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -529,6 +904,27 @@ async def main():
         help=f'Minimum realized PnL percentage (default: {MIN_REALIZED_PNL}%% - means return %, not dollars)'
     )
     
+    parser.add_argument(
+        '--discover-api',
+        metavar='WALLET',
+        help='Load one wallet page, list the JSON endpoints it calls (for DEXCHECK_STATS_API) and exit'
+    )
+    
+    parser.add_argument(
+        '--export-json',
+        nargs='?',
+        const=LEGACY_OUTPUT_FILE,
+        metavar='FILE',
+        help=f'Write the JSONL results as one JSON array (default: {LEGACY_OUTPUT_FILE}) and exit'
+    )
+    
+    parser.add_argument(
+        '--rps',
+        type=float,
+        default=None,
+        help='Maximum wallet page loads per second across all pages (default: one per page)'
+    )
+    
     args = parser.parse_args()
     
     # Validate pages
@@ -542,15 +938,35 @@ async def main():
         if response.lower() != 'y':
             return
     
+    if args.export_json:
+        migrate_legacy_results()
+        count = export_json(args.export_json)
+        print(f"{Colors.GREEN}✅ Exported {count} results to {args.export_json}{Colors.ENDC}")
+        return
+    
+    if args.discover_api:
+        async with BrowserPool(1) as pool:
+            await discover_api(pool, args.discover_api)
+        return
+    
     # Create and run scanner
     scanner = PlaywrightWalletScanner(
         num_pages=args.pages,
         min_winrate=args.min_winrate,
-        min_pnl=args.min_pnl
+        min_pnl=args.min_pnl,
+        max_rps=args.rps
     )
     
-    await scanner.run()
+    # The pool outlives a single run so callers can scan again without relaunching Chromium;
+    # two pages per worker so the next wallet can load while the current one is analyzed
+    async with BrowserPool(args.pages if STATS_API_TEMPLATE else args.pages * 2) as pool:
+        await scanner.run(pool)
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # libuv event loop; not available on Windows
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -3,6 +3,7 @@
 Beautiful logging formatter for the orchestrator
 """
 import logging
+import re
 import sys
 
 class Colors:
@@ -16,6 +17,9 @@ class Colors:
     BOLD = '\033[1m'
     DIM = '\033[2m'
 
+# Any of the verbose network errors rewritten below; one scan instead of a substring test each
+_REWRITES = re.compile(r"Failed to establish a new connection|Max retries exceeded|Network is unreachable")
+
 class BeautifulFormatter(logging.Formatter):
     """Custom formatter with colors and clean output"""
     
@@ -27,12 +31,19 @@ class BeautifulFormatter(logging.Formatter):
         logging.CRITICAL: f"{Colors.RED}{Colors.BOLD}🚨 %(message)s{Colors.ENDC}"
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # One formatter per level, built once instead of on every log call
+        self._formatters = {level: logging.Formatter(fmt) for level, fmt in self.FORMATS.items()}
+        self._default = logging.Formatter("%(message)s")
+    
     def format(self, record):
-        # Get the format for this log level
-        log_fmt = self.FORMATS.get(record.levelno, "%(message)s")
+        formatter = self._formatters.get(record.levelno, self._default)
         
         # Clean up common verbose patterns
         msg = record.getMessage()
+        if not _REWRITES.search(msg):
+            return formatter.format(record)
         
         # Shorten long error messages
         if "Failed to establish a new connection" in msg:
@@ -45,10 +56,11 @@ class BeautifulFormatter(logging.Formatter):
         elif "Network is unreachable" in msg:
             msg = "Network connection issue (continuing...)"
         
-        # Apply the format
-        record.msg = msg
-        formatter = logging.Formatter(log_fmt)
-        return formatter.format(record)
+        # Format a copy: the record is shared with the file handler, which must see the original
+        short_record = logging.makeLogRecord(record.__dict__)
+        short_record.msg = msg
+        short_record.args = None
+        return formatter.format(short_record)
 
 def setup_beautiful_logging():
     """Setup beautiful logging with both file and console handlers"""